@@ -123,6 +123,14 @@ QuantumState *qstate_clone(const QuantumState *qs);
  */
 MacQError qstate_init_basis(QuantumState *qs, const char *bitstring);
 
+/**
+ * Reset quantum state to |0...0⟩ in place, reusing its buffer.
+ *
+ * @param qs Quantum state
+ * @return Error code
+ */
+MacQError qstate_reset(QuantumState *qs);
+
 /**
  * Compute the norm of the quantum state.
  *
@@ -183,6 +191,16 @@ MacQError qstate_apply_z(QuantumState *qs, int target);
  */
 MacQError qstate_apply_h(QuantumState *qs, int target);
 
+/**
+ * Apply Hadamard to every qubit (H⊗n) in one call.
+ * Equivalent to qstate_apply_h on each qubit, but the low qubits are
+ * processed per cache tile and the normalization is applied once.
+ *
+ * @param qs Quantum state
+ * @return Error code
+ */
+MacQError qstate_apply_h_all(QuantumState *qs);
+
 /**
  * Apply S gate (phase gate, √Z) to target qubit.
  * Matrix: [[1, 0], [0, i]]
@@ -330,6 +348,20 @@ MacQError qstate_apply_mod_exp(QuantumState *qs, int a, int N, int num_controls,
 MacQError qstate_apply_cp(QuantumState *qs, int control, int target,
                           double phi);
 
+/**
+ * Apply a sequence of gates in order with a single call.
+ *
+ * Supports X, Y, Z, H, S, T, RX/RY/RZ (angle), CX, CZ, SWAP and CCX.
+ * Stops at the first failing gate; gates before it remain applied.
+ *
+ * @param qs Quantum state
+ * @param num_gates Number of gates
+ * @param gates Array of gates
+ * @return Error code (MACQ_ERROR_INVALID_GATE for unsupported types)
+ */
+MacQError qstate_apply_gates(QuantumState *qs, int num_gates,
+                             const QuantumGate *gates);
+
 // ============================================================================
 // Measurement
 // ============================================================================
@@ -361,6 +393,15 @@ double qstate_probability(const QuantumState *qs, int qubit);
  */
 double qstate_basis_probability(const QuantumState *qs, size_t basis_index);
 
+/**
+ * Write the probabilities of all basis states in one pass.
+ *
+ * @param qs Quantum state
+ * @param out Output array of length 2^n
+ * @return Error code
+ */
+MacQError qstate_get_probabilities(const QuantumState *qs, double *out);
+
 // ============================================================================
 // Utility Functions
 // ============================================================================
@@ -23,6 +23,7 @@
 
 #define MACQ_VERSION "1.0.0"
 #define MAX_QUBITS 30 // Maximum recommended qubits for full state vector
+#define H_ALL_TILE (1ULL << 12) // Amplitudes per cache tile in H⊗n
 
 // ============================================================================
 // Helper Functions
@@ -141,6 +142,17 @@ MacQError qstate_init_basis(QuantumState *qs, const char *bitstring) {
   return MACQ_SUCCESS;
 }
 
+MacQError qstate_reset(QuantumState *qs) {
+  if (!qs || !qs->state_vector)
+    return MACQ_ERROR_NULL_POINTER;
+
+  memset(qs->state_vector, 0, qs->vector_size * sizeof(cplx));
+  qs->state_vector[0] = 1.0 + 0.0 * I;
+  qs->norm = 1.0;
+
+  return MACQ_SUCCESS;
+}
+
 double qstate_norm(const QuantumState *qs) {
   if (!qs)
     return -1.0;
@@ -326,6 +338,49 @@ MacQError qstate_apply_h(QuantumState *qs, int target) {
   return MACQ_SUCCESS;
 }
 
+MacQError qstate_apply_h_all(QuantumState *qs) {
+  if (!qs || !qs->state_vector) {
+    return MACQ_ERROR_NULL_POINTER;
+  }
+
+  cplx *v = qs->state_vector;
+  const size_t n = qs->vector_size;
+  const size_t tile = n < H_ALL_TILE ? n : H_ALL_TILE;
+  const double scale = pow(2.0, -0.5 * qs->num_qubits);
+
+  // Unnormalized butterflies. The low qubits are done tile by tile so each
+  // tile stays in cache for all of its levels; the remaining high qubits
+  // take one sweep each. The 2^(-n/2) normalization is folded into the
+  // last level instead of a 1/√2 multiply per qubit.
+  for (size_t t = 0; t < n; t += tile) {
+    cplx *w = v + t;
+    for (size_t half = 1; half < tile; half <<= 1) {
+      const double f = (half << 1) == n ? scale : 1.0;
+      for (size_t base = 0; base < tile; base += half << 1) {
+        for (size_t i = base; i < base + half; i++) {
+          cplx a0 = w[i];
+          cplx a1 = w[i + half];
+          w[i] = f * (a0 + a1);
+          w[i + half] = f * (a0 - a1);
+        }
+      }
+    }
+  }
+  for (size_t half = tile; half < n; half <<= 1) {
+    const double f = (half << 1) == n ? scale : 1.0;
+    for (size_t base = 0; base < n; base += half << 1) {
+      for (size_t i = base; i < base + half; i++) {
+        cplx a0 = v[i];
+        cplx a1 = v[i + half];
+        v[i] = f * (a0 + a1);
+        v[i + half] = f * (a0 - a1);
+      }
+    }
+  }
+
+  return MACQ_SUCCESS;
+}
+
 MacQError qstate_apply_s(QuantumState *qs, int target) {
   if (!is_valid_qubit_index(qs, target)) {
     return MACQ_ERROR_INVALID_INDEX;
@@ -588,6 +643,70 @@ MacQError qstate_apply_cp(QuantumState *qs, int control, int target,
   return MACQ_SUCCESS;
 }
 
+MacQError qstate_apply_gates(QuantumState *qs, int num_gates,
+                             const QuantumGate *gates) {
+  if (!qs || (num_gates > 0 && !gates)) {
+    return MACQ_ERROR_NULL_POINTER;
+  }
+
+  for (int i = 0; i < num_gates; i++) {
+    const QuantumGate *g = &gates[i];
+    MacQError err;
+    switch (g->type) {
+    case GATE_I:
+      err = MACQ_SUCCESS;
+      break;
+    case GATE_X:
+      err = qstate_apply_x(qs, g->target);
+      break;
+    case GATE_Y:
+      err = qstate_apply_y(qs, g->target);
+      break;
+    case GATE_Z:
+      err = qstate_apply_z(qs, g->target);
+      break;
+    case GATE_H:
+      err = qstate_apply_h(qs, g->target);
+      break;
+    case GATE_S:
+      err = qstate_apply_s(qs, g->target);
+      break;
+    case GATE_T:
+      err = qstate_apply_t(qs, g->target);
+      break;
+    case GATE_RX:
+      err = qstate_apply_rx(qs, g->target, g->angle);
+      break;
+    case GATE_RY:
+      err = qstate_apply_ry(qs, g->target, g->angle);
+      break;
+    case GATE_RZ:
+      err = qstate_apply_rz(qs, g->target, g->angle);
+      break;
+    case GATE_CX:
+      err = qstate_apply_cnot(qs, g->control, g->target);
+      break;
+    case GATE_CZ:
+      err = qstate_apply_cz(qs, g->control, g->target);
+      break;
+    case GATE_SWAP:
+      err = qstate_apply_swap(qs, g->control, g->target);
+      break;
+    case GATE_CCX:
+      err = qstate_apply_toffoli(qs, g->control, g->control2, g->target);
+      break;
+    default:
+      err = MACQ_ERROR_INVALID_GATE;
+      break;
+    }
+    if (err != MACQ_SUCCESS) {
+      return err;
+    }
+  }
+
+  return MACQ_SUCCESS;
+}
+
 MacQError qstate_apply_qft(QuantumState *qs, int num_qubits, const int *qubits,
                            bool inverse) {
   if (!qs || !qubits || num_qubits < 1)
@@ -903,6 +1022,23 @@ double qstate_basis_probability(const QuantumState *qs, size_t basis_index) {
   return creal(amp) * creal(amp) + cimag(amp) * cimag(amp);
 }
 
+MacQError qstate_get_probabilities(const QuantumState *qs, double *out) {
+  if (!qs || !out) {
+    return MACQ_ERROR_NULL_POINTER;
+  }
+
+  // Read the amplitudes as interleaved (re, im) doubles so the loop
+  // vectorizes to a single pass over the state vector
+  const double *amp = (const double *)qs->state_vector;
+  for (size_t i = 0; i < qs->vector_size; i++) {
+    const double re = amp[2 * i];
+    const double im = amp[2 * i + 1];
+    out[i] = re * re + im * im;
+  }
+
+  return MACQ_SUCCESS;
+}
+
 // ============================================================================
 // Utility Functions
 // ============================================================================
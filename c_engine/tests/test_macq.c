@@ -314,6 +314,83 @@ int test_large_state() {
   return 1;
 }
 
+int test_gate_sequence() {
+  // Batched Bell state must match the single-gate calls
+  QuantumGate gates[] = {
+      {GATE_H, 0, -1, -1, 0.0, 0.0},
+      {GATE_CX, 1, 0, -1, 0.0, 0.0},
+  };
+  QuantumState *qs = qstate_create(2);
+  TEST_ASSERT(qstate_apply_gates(qs, 2, gates) == MACQ_SUCCESS,
+              "Gate sequence should apply");
+
+  double inv_sqrt2 = 1.0 / sqrt(2.0);
+  TEST_ASSERT(is_cplx_close(qs->state_vector[0], inv_sqrt2, EPSILON),
+              "Amplitude of |00⟩ should be 1/√2");
+  TEST_ASSERT(is_cplx_close(qs->state_vector[3], inv_sqrt2, EPSILON),
+              "Amplitude of |11⟩ should be 1/√2");
+
+  // Unsupported gate types are rejected
+  QuantumGate bad = {GATE_CSWAP, 0, 1, -1, 0.0, 0.0};
+  TEST_ASSERT(qstate_apply_gates(qs, 1, &bad) == MACQ_ERROR_INVALID_GATE,
+              "Unsupported gate should return MACQ_ERROR_INVALID_GATE");
+
+  qstate_free(qs);
+  return 1;
+}
+
+int test_hadamard_all() {
+  // 10 qubits fit in one cache tile; 14 also run the cross-tile sweep
+  const int sizes[] = {10, 14};
+
+  for (int k = 0; k < 2; k++) {
+    int n = sizes[k];
+    QuantumState *qs = qstate_create(n);
+    QuantumState *ref = qstate_create(n);
+
+    // Start from a non-trivial state so the butterflies are exercised,
+    // with amplitude spread across the low and high qubits
+    qstate_apply_rx(qs, 3, 0.7);
+    qstate_apply_cnot(qs, 3, n - 2);
+    qstate_apply_ry(qs, n - 1, 1.3);
+    qstate_apply_rx(ref, 3, 0.7);
+    qstate_apply_cnot(ref, 3, n - 2);
+    qstate_apply_ry(ref, n - 1, 1.3);
+
+    TEST_ASSERT(qstate_apply_h_all(qs) == MACQ_SUCCESS,
+                "H on all qubits should succeed");
+    for (int q = 0; q < n; q++) {
+      qstate_apply_h(ref, q);
+    }
+    for (size_t i = 0; i < qs->vector_size; i++) {
+      TEST_ASSERT(is_cplx_close(qs->state_vector[i], ref->state_vector[i],
+                                EPSILON),
+                  "H on all qubits should match per-qubit H");
+    }
+
+    qstate_free(qs);
+    qstate_free(ref);
+  }
+  return 1;
+}
+
+int test_reset() {
+  QuantumState *qs = qstate_create(3);
+
+  qstate_apply_h(qs, 0);
+  qstate_apply_cnot(qs, 0, 2);
+  TEST_ASSERT(qstate_reset(qs) == MACQ_SUCCESS, "Reset should succeed");
+  TEST_ASSERT(is_cplx_close(qs->state_vector[0], 1.0, EPSILON),
+              "Reset should give |000⟩");
+  for (size_t i = 1; i < qs->vector_size; i++) {
+    TEST_ASSERT(is_cplx_close(qs->state_vector[i], 0.0, EPSILON),
+                "Reset should clear all other amplitudes");
+  }
+
+  qstate_free(qs);
+  return 1;
+}
+
 // ============================================================================
 // Main Test Runner
 // ============================================================================
@@ -335,6 +412,9 @@ int main() {
   RUN_TEST(test_normalization);
   RUN_TEST(test_measurement);
   RUN_TEST(test_large_state);
+  RUN_TEST(test_gate_sequence);
+  RUN_TEST(test_hadamard_all);
+  RUN_TEST(test_reset);
 
   printf("========================================\n");
   printf("Test Summary\n");
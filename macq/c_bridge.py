@@ -9,7 +9,7 @@ Licensed under MIT License
 import ctypes
 import os
 import numpy as np
-from typing import Optional, List, Tuple
+from typing import Optional, List, Sequence, Tuple
 from enum import IntEnum
 
 # ============================================================================
@@ -106,6 +106,9 @@ _lib.qstate_clone.argtypes = [ctypes.c_void_p]
 _lib.qstate_init_basis.restype = ctypes.c_int
 _lib.qstate_init_basis.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
 
+_lib.qstate_reset.restype = ctypes.c_int
+_lib.qstate_reset.argtypes = [ctypes.c_void_p]
+
 _lib.qstate_norm.restype = ctypes.c_double
 _lib.qstate_norm.argtypes = [ctypes.c_void_p]
 
@@ -125,6 +128,9 @@ _lib.qstate_apply_z.argtypes = [ctypes.c_void_p, ctypes.c_int]
 _lib.qstate_apply_h.restype = ctypes.c_int
 _lib.qstate_apply_h.argtypes = [ctypes.c_void_p, ctypes.c_int]
 
+_lib.qstate_apply_h_all.restype = ctypes.c_int
+_lib.qstate_apply_h_all.argtypes = [ctypes.c_void_p]
+
 _lib.qstate_apply_s.restype = ctypes.c_int
 _lib.qstate_apply_s.argtypes = [ctypes.c_void_p, ctypes.c_int]
 
@@ -194,6 +200,9 @@ _lib.qstate_probability.argtypes = [ctypes.c_void_p, ctypes.c_int]
 _lib.qstate_basis_probability.restype = ctypes.c_double
 _lib.qstate_basis_probability.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
 
+_lib.qstate_get_probabilities.restype = ctypes.c_int
+_lib.qstate_get_probabilities.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_double)]
+
 # Complex number structure for ctypes
 class CComplex(ctypes.Structure):
     """C complex number compatible with C99 'double complex'"""
@@ -216,6 +225,35 @@ class QuantumGateC(ctypes.Structure):
 
 _lib.qstate_expectation_value.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.POINTER(QuantumGateC)]
 
+_lib.qstate_apply_gates.restype = ctypes.c_int
+_lib.qstate_apply_gates.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.POINTER(QuantumGateC)]
+
+# Gate types handled by qstate_apply_gates -> number of qubit operands
+# (rotations take their angle after the target)
+_SEQUENCE_QUBIT_COUNTS = {
+    **dict.fromkeys([GateType.GATE_I, GateType.GATE_X, GateType.GATE_Y, GateType.GATE_Z,
+                     GateType.GATE_H, GateType.GATE_S, GateType.GATE_T,
+                     GateType.GATE_RX, GateType.GATE_RY, GateType.GATE_RZ], 1),
+    **dict.fromkeys([GateType.GATE_CX, GateType.GATE_CZ, GateType.GATE_SWAP], 2),
+    GateType.GATE_CCX: 3,
+}
+_ROTATION_TYPES = frozenset({GateType.GATE_RX, GateType.GATE_RY, GateType.GATE_RZ})
+# Gates whose qubit operands must all differ (CZ and SWAP on one qubit are
+# well defined: Z and a no-op)
+_DISTINCT_OPERAND_TYPES = frozenset({GateType.GATE_CX, GateType.GATE_CCX})
+
+# Quantum State (read-only access to the amplitude buffer)
+class CQuantumState(ctypes.Structure):
+    """C QuantumState structure (matching macq.h)"""
+    _fields_ = [
+        ("num_qubits", ctypes.c_int),
+        ("vector_size", ctypes.c_size_t),
+        ("state_vector", ctypes.POINTER(CComplex)),
+        ("use_accelerate", ctypes.c_bool),
+        ("_aligned_buffer", ctypes.c_void_p),
+        ("norm", ctypes.c_double)
+    ]
+
 # Density Matrix
 class CDensityMatrix(ctypes.Structure):
     _fields_ = [
@@ -284,6 +322,9 @@ class QuantumState:
         
         self.num_qubits = num_qubits
         self.vector_size = 2 ** num_qubits
+        # Bumped on every in-place mutation so consumers can detect changes
+        self._version = 0
+        self._probs_cache = None
     
     def __del__(self):
         """Free C memory when Python object is destroyed"""
@@ -297,6 +338,8 @@ class QuantumState:
         new_state._ptr = _lib.qstate_clone(self._ptr)
         new_state.num_qubits = self.num_qubits
         new_state.vector_size = self.vector_size
+        new_state._version = 0
+        new_state._probs_cache = None
         return new_state
     
     def init_basis(self, bitstring: str) -> None:
@@ -313,6 +356,13 @@ class QuantumState:
         err = _lib.qstate_init_basis(self._ptr, bitstring.encode())
         if err != MacQError.SUCCESS:
             raise RuntimeError(f"Failed to initialize basis state: error {err}")
+        self._version += 1
+    
+    def reset(self) -> 'QuantumState':
+        """Reset to |0...0⟩ in place, reusing the state vector buffer"""
+        _lib.qstate_reset(self._ptr)
+        self._version += 1
+        return self
     
     def norm(self) -> float:
         """Calculate the norm of the quantum state"""
@@ -323,58 +373,75 @@ class QuantumState:
         err = _lib.qstate_normalize(self._ptr)
         if err != MacQError.SUCCESS:
             raise RuntimeError(f"Failed to normalize state: error {err}")
+        self._version += 1
     
     # Single-qubit gates
     def x(self, target: int) -> 'QuantumState':
         """Apply Pauli-X gate"""
         _lib.qstate_apply_x(self._ptr, target)
+        self._version += 1
         return self
     
     def y(self, target: int) -> 'QuantumState':
         """Apply Pauli-Y gate"""
         _lib.qstate_apply_y(self._ptr, target)
+        self._version += 1
         return self
     
     def z(self, target: int) -> 'QuantumState':
         """Apply Pauli-Z gate"""
         _lib.qstate_apply_z(self._ptr, target)
+        self._version += 1
         return self
     
     def h(self, target: int) -> 'QuantumState':
         """Apply Hadamard gate"""
         _lib.qstate_apply_h(self._ptr, target)
+        self._version += 1
+        return self
+    
+    def h_all(self) -> 'QuantumState':
+        """Apply Hadamard to every qubit (H⊗n) in one engine call"""
+        _lib.qstate_apply_h_all(self._ptr)
+        self._version += 1
         return self
     
     def s(self, target: int) -> 'QuantumState':
         """Apply S gate (phase gate)"""
         _lib.qstate_apply_s(self._ptr, target)
+        self._version += 1
         return self
     
     def t(self, target: int) -> 'QuantumState':
         """Apply T gate (π/8 gate)"""
         _lib.qstate_apply_t(self._ptr, target)
+        self._version += 1
         return self
     
     # Rotation gates
     def rx(self, target: int, theta: float) -> 'QuantumState':
         """Apply Rx(θ) rotation gate"""
         _lib.qstate_apply_rx(self._ptr, target, theta)
+        self._version += 1
         return self
     
     def ry(self, target: int, theta: float) -> 'QuantumState':
         """Apply Ry(θ) rotation gate"""
         _lib.qstate_apply_ry(self._ptr, target, theta)
+        self._version += 1
         return self
     
     def rz(self, target: int, theta: float) -> 'QuantumState':
         """Apply Rz(θ) rotation gate"""
         _lib.qstate_apply_rz(self._ptr, target, theta)
+        self._version += 1
         return self
     
     # Two-qubit gates
     def cnot(self, control: int, target: int) -> 'QuantumState':
         """Apply CNOT (Controlled-NOT) gate"""
         _lib.qstate_apply_cnot(self._ptr, control, target)
+        self._version += 1
         return self
     
     def cx(self, control: int, target: int) -> 'QuantumState':
@@ -384,17 +451,20 @@ class QuantumState:
     def cz(self, control: int, target: int) -> 'QuantumState':
         """Apply Controlled-Z gate"""
         _lib.qstate_apply_cz(self._ptr, control, target)
+        self._version += 1
         return self
     
     def swap(self, qubit1: int, qubit2: int) -> 'QuantumState':
         """Apply SWAP gate"""
         _lib.qstate_apply_swap(self._ptr, qubit1, qubit2)
+        self._version += 1
         return self
     
     # Three-qubit gates
     def toffoli(self, control1: int, control2: int, target: int) -> 'QuantumState':
         """Apply Toffoli (CCNOT) gate"""
         _lib.qstate_apply_toffoli(self._ptr, control1, control2, target)
+        self._version += 1
         return self
     
     def ccx(self, control1: int, control2: int, target: int) -> 'QuantumState':
@@ -405,6 +475,7 @@ class QuantumState:
     def cp(self, control: int, target: int, phi: float) -> 'QuantumState':
         """Apply Controlled-Phase gate"""
         _lib.qstate_apply_cp(self._ptr, control, target, phi)
+        self._version += 1
         return self
         
     def qft(self, qubits: List[int], inverse: bool = False) -> 'QuantumState':
@@ -412,6 +483,7 @@ class QuantumState:
         num_qubits = len(qubits)
         q_array = (ctypes.c_int * num_qubits)(*qubits)
         _lib.qstate_apply_qft(self._ptr, num_qubits, q_array, inverse)
+        self._version += 1
         return self
         
     def mod_exp(self, a: int, N: int, controls: List[int], targets: List[int]) -> 'QuantumState':
@@ -421,6 +493,61 @@ class QuantumState:
         c_array = (ctypes.c_int * num_c)(*controls)
         t_array = (ctypes.c_int * num_t)(*targets)
         _lib.qstate_apply_mod_exp(self._ptr, a, N, num_c, c_array, num_t, t_array)
+        self._version += 1
+        return self
+    
+    def apply_gates(self, gates: Sequence[Tuple]) -> 'QuantumState':
+        """
+        Apply a sequence of gates with a single call into the C engine.
+        
+        Args:
+            gates: Entries ``(GateType, *operands)`` with operands ordered as
+                in the single-gate methods: ``(GATE_H, target)``,
+                ``(GATE_RX, target, theta)``, ``(GATE_CX, control, target)``,
+                ``(GATE_SWAP, qubit1, qubit2)``,
+                ``(GATE_CCX, control1, control2, target)``
+        
+        Returns:
+            self, for chaining
+        
+        Raises:
+            ValueError: If a gate type is unsupported (e.g. CY, CSWAP, SDG),
+                a qubit index is out of range or a CX/CCX repeats a qubit;
+                checked for every gate before any is applied
+        """
+        num_gates = len(gates)
+        c_gates = (QuantumGateC * num_gates)()
+        for i, (c_gate, (gate_type, *operands)) in enumerate(zip(c_gates, gates)):
+            count = _SEQUENCE_QUBIT_COUNTS.get(gate_type)
+            if count is None:
+                raise ValueError(f"Gate {i}: unsupported gate type {gate_type!r} for apply_gates")
+            if gate_type in _ROTATION_TYPES:
+                if len(operands) != 2:
+                    raise ValueError(f"Gate {i}: {GateType(gate_type).name} takes (target, theta)")
+                c_gate.angle = operands.pop()
+            if len(operands) != count:
+                raise ValueError(f"Gate {i}: {GateType(gate_type).name} takes {count} qubit(s), "
+                                 f"got {len(operands)}")
+            for qubit in operands:
+                if not 0 <= qubit < self.num_qubits:
+                    raise ValueError(f"Gate {i}: invalid qubit index {qubit}")
+            if gate_type in _DISTINCT_OPERAND_TYPES and len(set(operands)) != count:
+                raise ValueError(f"Gate {i}: {GateType(gate_type).name} qubits must all differ, "
+                                 f"got {tuple(operands)}")
+            
+            c_gate.type = gate_type
+            c_gate.control = c_gate.control2 = -1
+            if count == 3:
+                c_gate.control, c_gate.control2, c_gate.target = operands
+            elif count == 2:
+                c_gate.control, c_gate.target = operands
+            else:
+                (c_gate.target,) = operands
+        
+        err = _lib.qstate_apply_gates(self._ptr, num_gates, c_gates)
+        self._version += 1
+        if err != MacQError.SUCCESS:
+            raise ValueError(f"Failed to apply gate sequence: error {err}")
         return self
     
     # Measurement
@@ -437,8 +564,36 @@ class QuantumState:
         result = _lib.qstate_measure(self._ptr, qubit)
         if result < 0:
             raise ValueError(f"Invalid qubit index: {qubit}")
+        self._version += 1
         return result
     
+    def sample(self, qubit: int, shots: int) -> np.ndarray:
+        """
+        Sample measurement outcomes of one qubit without collapsing the state.
+        
+        Each shot is an independent measurement of the current state, i.e.
+        the same distribution as ``clone().measure(qubit)`` repeated, but
+        drawn from one Born probability instead of copying the state per
+        shot. Unlike repeated measure() calls on this state, outcomes are
+        not conditioned on each other.
+        
+        Args:
+            qubit: Qubit index to sample
+            shots: Number of samples
+        
+        Returns:
+            uint8 numpy array of shape (shots,) with outcomes (0 or 1)
+        
+        Raises:
+            ValueError: If qubit is out of range or shots is negative
+        """
+        if not 0 <= qubit < self.num_qubits:
+            raise ValueError(f"Invalid qubit index: {qubit}")
+        if shots < 0:
+            raise ValueError(f"shots must be non-negative, got {shots}")
+        p_one = _lib.qstate_probability(self._ptr, qubit)
+        return np.random.binomial(1, min(p_one, 1.0), size=shots).astype(np.uint8)
+    
     def probability(self, qubit: int) -> float:
         """Get probability of measuring qubit in |1⟩ state"""
         return _lib.qstate_probability(self._ptr, qubit)
@@ -459,21 +614,80 @@ class QuantumState:
         Returns:
             Complex numpy array of shape (2^n,)
         """
-        vec = np.zeros(self.vector_size, dtype=np.complex128)
-        for i in range(self.vector_size):
-            vec[i] = self.get_amplitude(i)
-        return vec
+        return self._amplitude_view().copy()
+    
+    def _amplitude_view(self) -> np.ndarray:
+        """Zero-copy complex128 view of the C state vector buffer"""
+        cstate = ctypes.cast(self._ptr, ctypes.POINTER(CQuantumState)).contents
+        buf = ctypes.cast(cstate.state_vector, ctypes.POINTER(ctypes.c_double))
+        return np.ctypeslib.as_array(buf, shape=(2 * self.vector_size,)).view(np.complex128)
     
-    def probabilities(self) -> np.ndarray:
+    @property
+    def amplitudes_array(self) -> np.ndarray:
+        """
+        Read-only zero-copy view of the state vector.
+        
+        The array aliases the C buffer: it reflects later gates and must
+        not be used after this state has been freed.
+        """
+        view = self._amplitude_view()
+        view.flags.writeable = False
+        return view
+    
+    @property
+    def probabilities_array(self) -> np.ndarray:
+        """
+        Read-only float64 array of basis state probabilities.
+        
+        Computed once per state version and shared by all callers until
+        the next gate is applied; copy it if it must outlive the state.
+        """
+        cached = self._probs_cache
+        if cached is None or cached[0] != self._version:
+            probs = self.probabilities_into(np.empty(self.vector_size))
+            probs.flags.writeable = False
+            self._probs_cache = cached = (self._version, probs)
+        return cached[1]
+    
+    def probabilities(self, dtype=np.float64) -> np.ndarray:
         """
         Get probabilities of all basis states.
         
+        Args:
+            dtype: Result dtype; np.float32 halves the size of the returned
+                array (the engine state itself is always complex128)
+        
         Returns:
             Real numpy array of shape (2^n,) with probabilities
         """
-        vec = self.get_statevector()
-        return np.abs(vec) ** 2
-
+        if np.dtype(dtype) == np.float64:
+            return self.probabilities_into(np.empty(self.vector_size))
+        vec = self._amplitude_view()
+        # Square straight into the narrower dtype, no float64 temporaries
+        probs = np.square(vec.real, dtype=dtype)
+        probs += np.square(vec.imag, dtype=dtype)
+        return probs
+
+    def probabilities_into(self, out: np.ndarray) -> np.ndarray:
+        """
+        Write basis state probabilities into a preallocated array.
+        
+        Computed by the engine in one pass, without the temporaries of
+        ``vec.real ** 2 + vec.imag ** 2``.
+        
+        Args:
+            out: C-contiguous float64 array of shape (2^n,)
+        
+        Returns:
+            out
+        """
+        if (out.dtype != np.float64 or out.shape != (self.vector_size,)
+                or not out.flags.c_contiguous or not out.flags.writeable):
+            raise ValueError(
+                f"out must be a writeable contiguous float64 array of shape ({self.vector_size},)")
+        _lib.qstate_get_probabilities(self._ptr, out.ctypes.data_as(ctypes.POINTER(ctypes.c_double)))
+        return out
+    
     def sample_counts(self, shots: int) -> dict:
         """
         Perform weighted random sampling based on current state probabilities.
@@ -508,16 +722,19 @@ class QuantumState:
     def apply_amplitude_damping(self, target: int, rate: float) -> 'QuantumState':
         """Apply amplitude damping noise stochastic model"""
         _lib.qstate_apply_amplitude_damping(self._ptr, target, rate)
+        self._version += 1
         return self
         
     def apply_phase_damping(self, target: int, rate: float) -> 'QuantumState':
         """Apply phase damping noise stochastic model"""
         _lib.qstate_apply_phase_damping(self._ptr, target, rate)
+        self._version += 1
         return self
         
     def apply_depolarizing(self, target: int, rate: float) -> 'QuantumState':
         """Apply depolarizing noise stochastic model"""
         _lib.qstate_apply_depolarizing(self._ptr, target, rate)
+        self._version += 1
         return self
 
     def expectation_value(self, gates: List[Tuple]) -> float:
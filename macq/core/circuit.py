@@ -3,16 +3,20 @@ MacQ Core - Circuit Representation and Execution
 Standalone circuit object that handles gates, metadata, and execution via C bridge.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
 import numpy as np
 from ..c_bridge import QuantumState, DensityMatrix
 
+if TYPE_CHECKING:
+    from ..qlang.compiler import Gate
+
 class Circuit:
     """Standalone Quantum Circuit object for headless/scripted usage."""
     
     def __init__(self, num_qubits: int = 3):
         self.num_qubits = num_qubits
-        self.gates: List[Dict[str, Any]] = []
+        # Gate records, whether added here or compiled from Q-Lang
+        self.gates: List['Gate'] = []
         self._metadata: Dict[str, Any] = {}
 
     def add_gate(self, gate_type: str, qubit: int, time_step: int = None, 
@@ -21,14 +25,8 @@ class Circuit:
         if time_step is None:
             time_step = self._next_available_time_step(qubit)
             
-        gate = {
-            'type': gate_type,
-            'qubit': qubit,
-            'time_step': time_step,
-            'control': control,
-            'control2': control2,
-            'params': params or {}
-        }
+        from ..qlang.compiler import Gate
+        gate = Gate(gate_type, qubit, time_step, control, control2, params or {})
         self.gates.append(gate)
         # Keep gates sorted by time_step
         self.gates.sort(key=lambda g: g['time_step'])
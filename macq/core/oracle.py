@@ -4,7 +4,9 @@ Compiles high-level boolean expressions into quantum circuits.
 """
 
 import ast
-from typing import List, Dict, Any
+import copy
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple
 
 class ExpressionToGates:
     """
@@ -22,6 +24,14 @@ class ExpressionToGates:
         Evaluate the expression for all 2^n inputs and generate MCX gates for minterms.
         """
         n = len(self.inputs)
+        # Replace logical operators with bitwise ones if not already
+        expr = self.expression.replace(' and ', ' & ').replace(' or ', ' | ').replace(' not ', ' ~ ')
+        try:
+            code = compile(expr, '<string>', 'eval')  # once, not per row
+        except SyntaxError as e:
+            print(f"Error evaluating expression: {e}")
+            return self.gates
+
         for i in range(2**n):
             # Map inputs to bits
             bits = [(i >> (n - 1 - j)) & 1 for j in range(n)]
@@ -29,9 +39,7 @@ class ExpressionToGates:
             
             # Evaluate expression safely
             try:
-                # Replace logical operators with bitwise ones if not already
-                expr = self.expression.replace(' and ', ' & ').replace(' or ', ' | ').replace(' not ', ' ~ ')
-                result = eval(expr, {"__builtins__": None}, scope)
+                result = eval(code, {"__builtins__": None}, scope)
                 
                 if result & 1:
                     # Found a minterm!
@@ -56,8 +64,14 @@ class ExpressionToGates:
         
         return self.gates
 
+@lru_cache(maxsize=256)
+def _build_cached(expression: str, inputs: Tuple[str, ...], target: str) -> List[Dict[str, Any]]:
+    return ExpressionToGates(expression, list(inputs), target).compile()
+
+
 class OracleBuilder:
     @staticmethod
     def build_from_expression(expression: str, inputs: List[str], target: str) -> List[Dict[str, Any]]:
-        compiler = ExpressionToGates(expression, inputs, target)
-        return compiler.compile()
+        # Truth-table expansion is O(2^n); identical oracles are built once
+        # and callers get their own copy of the gate list
+        return copy.deepcopy(_build_cached(expression, tuple(inputs), target))
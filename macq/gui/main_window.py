@@ -331,9 +331,9 @@ class MainWindow(QMainWindow):
         # Clear current circuit
         self.circuit_editor.clear_circuit()
         
-        # Add compiled gates
+        # Add compiled gates (the editor keeps its gates as plain dicts)
         for gate in gates:
-            self.circuit_editor.gates.append(gate)
+            self.circuit_editor.gates.append(dict(gate))
         
         # Update geometry and display
         self.circuit_editor._update_size()
@@ -362,6 +362,7 @@ class MainWindow(QMainWindow):
         
         # Toolbar buttons
         self.run_btn.clicked.connect(self._run_circuit)
+        self.visualizer.render_failed.connect(self._on_render_failed)
         self.qubit_spinner.valueChanged.connect(self._on_qubit_count_changed)
         
         # Set initial qubit count for Q-Lang editor
@@ -572,6 +573,7 @@ class MainWindow(QMainWindow):
                 
                 # 3. 更新可视化
                 # 注意：如果是 Noisy 模式，result_state 是带噪态，theo_probs 将反映噪声后的分布
+                # 重绘由可视化面板的定时器合并执行，出错时经 render_failed 提示
                 self.visualizer.update_state(result_state, counts=counts, shots=shots if is_noisy else None)
                 
                 self.status_label.setText("电路运行完成" + (" (Noisy/Experimental)" if is_noisy else " (Ideal)"))
@@ -587,6 +589,14 @@ class MainWindow(QMainWindow):
             )
             self.status_label.setText("执行失败")
             
+    def _on_render_failed(self, message):
+        """延迟重绘出错时的提示 (与 _run_circuit 的错误处理一致)"""
+        QMessageBox.critical(
+            self, "执行错误",
+            f"电路执行时发生错误:\n{message}"
+        )
+        self.status_label.setText("执行失败")
+        
     def _show_hamiltonian(self):
         """计算并显示电路的哈密顿量/幺正矩阵"""
         from .hamiltonian_dialog import HamiltonianDialog
@@ -207,6 +207,9 @@ class QLangEditorWidget(QWidget):
     
     def set_qubit_count(self, num_qubits: int):
         """Set the number of qubits for validation"""
+        if self.validator is not None:
+            self.validator.reset(num_qubits)
+            return
         from macq.qlang.validator import QLangValidator
         self.validator = QLangValidator(num_qubits)
     
@@ -4,28 +4,88 @@ Probability charts and state visualization
 """
 
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QTabWidget
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer, Signal
 
 import matplotlib
-matplotlib.use('Qt5Agg')
-# 配置中文字体
-import matplotlib.pyplot as plt
-plt.rcParams['font.sans-serif'] = ['Arial Unicode MS', 'SimHei', 'DejaVu Sans']  # macOS中文字体
-plt.rcParams['axes.unicode_minus'] = False  # 解决负号显示问题
+
+_MATPLOTLIB_CONFIGURED = False
+
+
+def _configure_matplotlib():
+    """设置 Qt 后端与中文字体 (进程内只执行一次)"""
+    global _MATPLOTLIB_CONFIGURED
+    if _MATPLOTLIB_CONFIGURED:
+        return
+    matplotlib.use('Qt5Agg')
+    matplotlib.rcParams.update({
+        'font.sans-serif': ['Arial Unicode MS', 'SimHei', 'DejaVu Sans'],  # macOS中文字体
+        'axes.unicode_minus': False,  # 解决负号显示问题
+    })
+    _MATPLOTLIB_CONFIGURED = True
+
+
+_configure_matplotlib()
 
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
 from matplotlib.figure import Figure
 import numpy as np
 
 
+# 超过该数量的标签改用 NumPy 批量生成
+_BULK_LABEL_THRESHOLD = 50
+
+
+def _binary_labels(indices, num_qubits):
+    """生成 |b…b⟩ 形式的基态标签 (高位在前)"""
+    idx_arr = np.asarray(indices, dtype=np.int64)
+    if len(idx_arr) <= _BULK_LABEL_THRESHOLD:
+        fmt = f"|{{:0{num_qubits}b}}⟩"
+        return [fmt.format(i) for i in idx_arr.tolist()]
+    
+    # 逐位展开为 ASCII 字节矩阵，每行视为一个定长字符串
+    bits = (idx_arr[:, None] >> np.arange(num_qubits - 1, -1, -1)) & 1
+    rows = (bits + ord('0')).astype(np.uint8).view(f'S{num_qubits}').ravel()
+    return np.char.add(np.char.add('|', rows.astype(f'U{num_qubits}')), '⟩').tolist()
+
+
+def _bitstrings_to_indices(keys, num_qubits):
+    """把等宽比特串 (高位在前) 批量转换为基态索引"""
+    if num_qubits > 0 and all(len(k) == num_qubits for k in keys):
+        # 非 ASCII 字符替换为 '?'，保证每个字符占一个字节
+        joined = "".join(keys).encode('ascii', 'replace')
+        bits = np.frombuffer(joined, dtype=np.uint8).reshape(-1, num_qubits) - ord('0')
+        if not (bits > 1).any():  # 只含 '0'/'1' (其他字符相减后 > 1 或回绕)
+            weights = np.left_shift(1, np.arange(num_qubits - 1, -1, -1, dtype=np.int64))
+            return bits.astype(np.int64) @ weights
+    # 宽度或字符不符时退回逐个解析
+    return np.fromiter((int(k, 2) for k in keys), dtype=np.int64, count=len(keys))
+
+
 class VisualizationWidget(QWidget):
     """可视化面板"""
     
+    # 定时器触发的重绘出错时发出 (错误信息)，调用方已返回，无法再捕获异常
+    render_failed = Signal(str)
+    
+    # 合并刷新的最短间隔 (毫秒)，约 30 FPS
+    UPDATE_INTERVAL_MS = 33
+    
     def __init__(self):
         super().__init__()
         self.setMinimumWidth(300)
-        self._init_ui()
         self.current_state = None
+        # 上次纯态渲染的 (id, _version)，用于跳过重复刷新
+        self._last_state_token = None
+        # 最新一次 update_state 的数据及其序号；各标签页记录已渲染的序号，切换到时再补绘
+        self._latest = None
+        self._serial = 0
+        self._tab_serial = {}
+        # 高频 update_state 调用只保留最新参数，由单次定时器统一重绘
+        self._pending = None
+        self._coalesce_timer = QTimer(self)
+        self._coalesce_timer.setSingleShot(True)
+        self._coalesce_timer.timeout.connect(self._do_update)
+        self._init_ui()
         
     def _init_ui(self):
         """初始化UI"""
@@ -62,34 +122,91 @@ class VisualizationWidget(QWidget):
         self.state_view = StateVectorView()
         self.tabs.addTab(self.state_view, "🔢 态向量")
         
+        self.tabs.currentChanged.connect(self._on_tab_changed)
         layout.addWidget(self.tabs)
         
     def update_state(self, quantum_state, density_matrix=None, counts=None, shots=None):
-        """更新量子态显示"""
-        self.current_state = quantum_state
-        
-        # 更新概率图 (Histogram 2.0)
-        self.prob_chart.update_data(quantum_state, counts, shots)
+        """更新量子态显示 (合并刷新，最多每 UPDATE_INTERVAL_MS 重绘一次)"""
+        self._pending = (quantum_state, density_matrix, counts, shots)
+        if not self._coalesce_timer.isActive():
+            self._coalesce_timer.start(self.UPDATE_INTERVAL_MS)
+    
+    def _do_update(self):
+        """定时器槽：重绘并把异常转为 render_failed 信号"""
+        try:
+            self._render_pending()
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            self.render_failed.emit(str(e))
+    
+    def _render_pending(self):
+        """取出最新一次 update_state 的参数并重绘"""
+        if self._pending is None:
+            return
+        quantum_state, density_matrix, counts, shots = self._pending
+        self._pending = None
+        
+        # 同一对象且未被修改时无需重绘 (带采样/密度矩阵的刷新总是重绘)
+        version = getattr(quantum_state, '_version', None)
+        token = (id(quantum_state), version) if version is not None else None
+        if counts is None and density_matrix is None:
+            if token is not None and token == self._last_state_token:
+                return
+            self._last_state_token = token
+        else:
+            self._last_state_token = None
         
-        # 更新热力图
-        if density_matrix:
-            self.heatmap_view.update_heatmap(density_matrix)
-        elif quantum_state:
-            # 如果没有显式传DM，可以从QS生成（小规模比特）
-            if quantum_state.num_qubits <= 6:
-                from ..c_bridge import DensityMatrix
-                dm = DensityMatrix.from_statevector(quantum_state)
-                self.heatmap_view.update_heatmap(dm)
+        self.current_state = quantum_state
         
-        # 更新相位盘
-        self.phase_disks.update_disks(quantum_state)
+        # 态向量与 |ψ|² 只计算一次，供各子视图共享
+        vec = quantum_state.get_statevector()
+        probs = quantum_state.probabilities_array
         
-        # 更新态向量
-        self.state_view.update_state(quantum_state)
+        # 只重绘当前可见的标签页，其余在切换时补绘
+        self._latest = (quantum_state, density_matrix, counts, shots, vec, probs)
+        self._serial += 1
+        self._render_tab(self.tabs.currentIndex())
+    
+    def _on_tab_changed(self, index):
+        """标签页切换时补绘过期内容"""
+        self._render_tab(index)
+    
+    def _render_tab(self, index):
+        """把最新数据推送到指定标签页 (已是最新则跳过)"""
+        if self._latest is None or self._tab_serial.get(index) == self._serial:
+            return
+        quantum_state, density_matrix, counts, shots, vec, probs = self._latest
+        widget = self.tabs.widget(index)
+        
+        if widget is self.prob_chart:
+            # 更新概率图 (Histogram 2.0)
+            self.prob_chart.update_data(quantum_state, counts, shots, probs=probs)
+        elif widget is self.heatmap_view:
+            # 更新热力图
+            if density_matrix is not None:
+                self.heatmap_view.update_heatmap(density_matrix)
+            elif quantum_state:
+                # 如果没有显式传DM，纯态 ρ = |ψ⟩⟨ψ| 直接由态向量外积得到（小规模比特）
+                if quantum_state.num_qubits <= 6:
+                    self.heatmap_view.update_heatmap(np.outer(vec, vec.conj()))
+        elif widget is self.phase_disks:
+            # 更新相位盘
+            self.phase_disks.update_disks(quantum_state, vec=vec)
+        elif widget is self.state_view:
+            # 更新态向量
+            self.state_view.update_state(quantum_state, vec=vec, probs=probs)
+        
+        self._tab_serial[index] = self._serial
     
     def clear(self):
         """清空显示"""
+        self._coalesce_timer.stop()
+        self._pending = None
         self.current_state = None
+        self._last_state_token = None
+        self._latest = None
+        self._tab_serial = {}
         self.prob_chart.clear()
         self.heatmap_view.clear()
         self.phase_disks.clear()
@@ -99,6 +216,9 @@ class VisualizationWidget(QWidget):
 class ProbabilityChart(FigureCanvasQTAgg):
     """概率分布图 - Premium版本"""
     
+    MAX_BARS = 24          # 最多显示的基态柱数
+    MIN_BAR_PIXELS = 25    # 每根柱至少占用的像素宽度
+    
     def __init__(self):
         fig = Figure(figsize=(5, 4), dpi=100, facecolor='#FAFAFA')
         self.axes = fig.add_subplot(111)
@@ -119,44 +239,38 @@ class ProbabilityChart(FigureCanvasQTAgg):
         # Register mapping: {reg_name: [qubit_indices]}
         self.registers = {}
         
-    def update_data(self, state, counts=None, shots=None):
-        """更新概率显示 - Histogram 2.0 (理论 vs 实验)"""
-        theo_probs = state.probabilities()
+    def update_data(self, state, counts=None, shots=None, probs=None):
+        """更新概率显示 - Histogram 2.0 (理论 vs 实验)
+        
+        probs: 可选的预计算概率数组，省略时从 state 计算
+        """
+        theo_probs = probs if probs is not None else state.probabilities_array
         num_qubits = state.num_qubits
         
         self.axes.clear()
         
         # 智能选择显示的前 N 个基态
         threshold = 0.001
-        significant_indices = [i for i, p in enumerate(theo_probs) if p > threshold]
+        significant_indices = np.flatnonzero(theo_probs > threshold)
         
         if counts:
             # 如果有采样数据，也包含采样中出现的索引
-            for bin_str, _ in counts.items():
-                idx = int(bin_str, 2)
-                if idx not in significant_indices:
-                    significant_indices.append(idx)
-        
-        significant_indices = sorted(significant_indices)
-        if len(significant_indices) > 24:
-            significant_indices = significant_indices[:24]
-            
-        def get_label(idx):
-            bin_str = f"{idx:0{num_qubits}b}"
-            if not self.registers:
-                return f"|{bin_str}⟩"
+            counts_idx = _bitstrings_to_indices(list(counts), num_qubits)
+            counts_vals = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+            significant_indices = np.union1d(significant_indices, counts_idx)
+        
+        # flatnonzero/union1d 均返回有序索引
+        # 按画布宽度限制柱数，超出部分汇总为一根 "…" 柱
+        max_bars = max(2, min(self.MAX_BARS, self.width() // self.MIN_BAR_PIXELS))
+        truncated = len(significant_indices) > max_bars
+        if truncated:
+            significant_indices = significant_indices[:max_bars - 1]
             
-            labels = []
-            for name, indices in self.registers.items():
-                val = 0
-                for i, q_idx in enumerate(reversed(indices)):
-                    if bin_str[q_idx] == '1':
-                        val += (1 << i)
-                labels.append(f"{name}={val}")
-            return "| " + " ⊗ ".join(labels) + " ⟩"
-
-        labels = [get_label(i) for i in significant_indices]
-        theo_vals = [theo_probs[i] for i in significant_indices]
+        labels = self._basis_labels(significant_indices, num_qubits)
+        theo_vals = theo_probs[significant_indices]
+        if truncated:
+            labels.append("…")
+            theo_vals = np.append(theo_vals, max(theo_probs.sum() - theo_vals.sum(), 0.0))
         
         x = np.arange(len(labels))
         width = 0.35 if counts else 0.7
@@ -166,9 +280,17 @@ class ProbabilityChart(FigureCanvasQTAgg):
                      label='理论值', color='#4A90E2', alpha=0.3, edgecolor='#4A90E2', hatch='//')
         
         # 绘制实验值 (实心)
+        exp_vals = np.zeros(0)
         if counts and shots:
-            exp_vals = [counts.get(l, 0) / shots for l in labels]
-            error = [np.sqrt(v * (1-v) / shots) if shots > 0 else 0 for v in exp_vals]
+            # 按基态索引对齐采样计数 (counts 的键是比特串而非显示标签)
+            order = np.argsort(counts_idx)
+            sorted_idx = counts_idx[order]
+            pos = np.minimum(np.searchsorted(sorted_idx, significant_indices), len(sorted_idx) - 1)
+            hit = sorted_idx[pos] == significant_indices
+            exp_vals = np.where(hit, counts_vals[order][pos], 0.0) / shots
+            if truncated:
+                exp_vals = np.append(exp_vals, max(counts_vals.sum() / shots - exp_vals.sum(), 0.0))
+            error = np.sqrt(exp_vals * (1 - exp_vals) / shots)
             
             self.axes.bar(x + width/2, exp_vals, width, label='实验值', color='#FF6B9D', alpha=0.9)
             self.axes.errorbar(x + width/2, exp_vals, yerr=error, fmt='none', ecolor='#2C3E50', capsize=3)
@@ -178,12 +300,29 @@ class ProbabilityChart(FigureCanvasQTAgg):
         self.axes.set_title(f'量子态统计 (Shots={shots if shots else "∞"})', fontsize=14, fontweight='bold')
         self.axes.set_xticks(x)
         self.axes.set_xticklabels(labels, rotation=45, ha='right', fontsize=9)
-        self.axes.set_ylim([0, max(max(theo_vals), max([counts.get(l, 0)/shots for l in labels] if counts else [0])) * 1.3 or 1.0])
+        self.axes.set_ylim([0, max(theo_vals.max(initial=0), exp_vals.max(initial=0)) * 1.3 or 1.0])
         self.axes.grid(True, axis='y', alpha=0.2)
         
         self.figure.tight_layout()
         self.draw()
     
+    def _basis_labels(self, indices, num_qubits):
+        """生成基态标签；定义了寄存器时显示各寄存器的整数值"""
+        idx_arr = np.asarray(indices, dtype=np.int64)
+        if not self.registers:
+            return _binary_labels(idx_arr, num_qubits)
+        
+        # 比特串第 q 位 (高位在前) 对应索引的第 n-1-q 位；寄存器中最后一个比特为最低位
+        reg_vals = []
+        for name, qubit_indices in self.registers.items():
+            shifts = num_qubits - 1 - np.asarray(qubit_indices, dtype=np.int64)
+            bits = (idx_arr[:, None] >> shifts) & 1
+            weights = np.left_shift(1, np.arange(len(qubit_indices) - 1, -1, -1, dtype=np.int64))
+            reg_vals.append((name, (bits @ weights).tolist()))
+        
+        return ["| " + " ⊗ ".join(f"{name}={vals[k]}" for name, vals in reg_vals) + " ⟩"
+                for k in range(len(idx_arr))]
+    
     def clear(self):
         """清空图表"""
         self.axes.clear()
@@ -199,34 +338,50 @@ class HeatmapView(FigureCanvasQTAgg):
         self.ax_real = fig.add_subplot(121)
         self.ax_imag = fig.add_subplot(122)
         super().__init__(fig)
+        # 实部/虚部图像，矩阵维度不变时通过 set_data 复用
+        self.im_real = None
+        self.im_imag = None
         
-    def update_heatmap(self, dm):
-        data = dm.to_numpy()
-        
+    def _build_images(self, dim):
+        """按矩阵维度创建两幅 imshow 图像及基态标签"""
         self.ax_real.clear()
         self.ax_imag.clear()
         
-        im1 = self.ax_real.imshow(np.real(data), cmap='RdBu', vmin=-1, vmax=1)
+        blank = np.zeros((dim, dim))
+        self.im_real = self.ax_real.imshow(blank, cmap='RdBu', vmin=-1, vmax=1)
         self.ax_real.set_title("实部 (Real)")
         
-        im2 = self.ax_imag.imshow(np.imag(data), cmap='RdBu', vmin=-1, vmax=1)
+        self.im_imag = self.ax_imag.imshow(blank, cmap='RdBu', vmin=-1, vmax=1)
         self.ax_imag.set_title("虚部 (Imag)")
         
         # 简单显示基态标签
-        if dm.num_qubits <= 3:
-            ticks = range(2**dm.num_qubits)
-            labels = [f"{i:0{dm.num_qubits}b}" for i in ticks]
+        num_qubits = dim.bit_length() - 1
+        if num_qubits <= 3:
+            ticks = range(dim)
+            labels = [f"{i:0{num_qubits}b}" for i in ticks]
             self.ax_real.set_xticks(ticks)
             self.ax_real.set_xticklabels(labels, fontsize=8, rotation=90)
             self.ax_real.set_yticks(ticks)
             self.ax_real.set_yticklabels(labels, fontsize=8)
             
         self.figure.tight_layout()
-        self.draw()
+        
+    def update_heatmap(self, dm):
+        """更新热力图，dm 可为 DensityMatrix 或 (2^n, 2^n) 复数数组"""
+        data = dm if isinstance(dm, np.ndarray) else dm.to_numpy()
+        
+        if self.im_real is None or self.im_real.get_array().shape != data.shape:
+            self._build_images(data.shape[0])
+        
+        self.im_real.set_data(np.real(data))
+        self.im_imag.set_data(np.imag(data))
+        self.draw_idle()
         
     def clear(self):
         self.ax_real.clear()
         self.ax_imag.clear()
+        self.im_real = None
+        self.im_imag = None
         self.draw()
 
 
@@ -237,25 +392,87 @@ class PhaseDiskView(FigureCanvasQTAgg):
         # 创建多个子图以容纳所有比特
         fig = Figure(figsize=(8, 3), dpi=100)
         super().__init__(fig)
-        
-    def update_disks(self, state):
+        # 每个比特的极坐标子图与相位指针，比特数不变时复用
+        self.disk_axes = []
+        self.arrows = []
+        self.backgrounds = []
+        self.ground_labels = []
+        # 上次绘制时各比特的约化密度矩阵，未变化则跳过
+        self._last_rho = []
+        
+    def _build_disks(self, count):
+        """创建 count 个相位盘 (背景圆盘与指针只创建一次)"""
         self.figure.clear()
+        self.disk_axes = []
+        self.arrows = []
+        self.backgrounds = []
+        self.ground_labels = []
+        self._last_rho = [None] * count
+        theta = np.linspace(0, 2 * np.pi, 73)
+        
+        for i in range(count):
+            ax = self.figure.add_subplot(1, count, i+1, projection='polar')
+            
+            # 圆盘背景 (代表概率幅)
+            background, = ax.fill(theta, np.ones_like(theta), color='#4A90E2', alpha=0.1)
+            # 相位指针，端点加圆点标示方向
+            arrow, = ax.plot([0, 0], [0, 0], color='#4A90E2', lw=3,
+                             marker='o', markevery=[1], markersize=6)
+            # 比特处于 |0⟩ 时只显示静态标签
+            ground = ax.text(0.5, 0.5, "|0⟩", transform=ax.transAxes, ha='center',
+                             va='center', fontsize=14, color='#AAAAAA', visible=False)
+            
+            ax.set_ylim(0, 1)
+            ax.set_title(f"q{i}", fontsize=11, fontweight='bold', color='#2C3E50')
+            ax.set_yticklabels([])
+            ax.set_xticklabels([])
+            ax.grid(True, alpha=0.1)
+            
+            self.disk_axes.append(ax)
+            self.arrows.append(arrow)
+            self.backgrounds.append(background)
+            self.ground_labels.append(ground)
+            
+        self.figure.tight_layout()
+        
+    def _set_ground(self, i, ground):
+        """切换比特 i 的相位盘与 |0⟩ 静态标签"""
+        self.disk_axes[i].axison = not ground
+        self.backgrounds[i].set_visible(not ground)
+        self.arrows[i].set_visible(not ground)
+        self.ground_labels[i].set_visible(ground)
+        
+    def update_disks(self, state, vec=None):
+        """更新相位盘
+        
+        vec: 可选的预计算态向量，省略时从 state 读取
+        """
         n = state.num_qubits
         display_n = min(n, 8)
+        if vec is None:
+            vec = state.get_statevector()
+        # 轴 k 对应比特 n-1-k (比特 i 为基态索引的第 i 位)
+        psi = vec.reshape((2,) * n)
         
+        if len(self.disk_axes) != display_n:
+            self._build_disks(display_n)
+        
+        changed = False
         for i in range(display_n):
-            ax = self.figure.add_subplot(1, display_n, i+1, projection='polar')
-            
             # 简化版单比特相位：通过测量概率和相对相位估计
             # 在 MacQ 中，我们可以直接从状态向量提取
             # 对于比特 i，我们看 |...0...i...0...> vs |...0...1...0...> 这种基态的一个切片
             # 或者更准确地，计算约化密度矩阵 rho_i 的非对角项
             try:
-                from ..c_bridge import DensityMatrix
-                dm = DensityMatrix.from_statevector(state)
-                # Trace out all but qubit i
-                qubits_to_trace = [j for j in range(n) if j != i]
-                rho_i = dm.partial_trace(qubits_to_trace).to_numpy()
+                # Trace out all but qubit i: rho_i = M M†，M 为以比特 i 为行的振幅矩阵
+                m = np.moveaxis(psi, n - 1 - i, 0).reshape(2, -1)
+                rho_i = m @ m.conj().T
+                
+                last = self._last_rho[i]
+                if last is not None and np.allclose(rho_i, last):
+                    continue
+                self._last_rho[i] = rho_i
+                changed = True
                 
                 # rho_i = [[rho00, rho01], [rho10, rho11]]
                 # rho11 是处于 |1> 的概率
@@ -263,32 +480,36 @@ class PhaseDiskView(FigureCanvasQTAgg):
                 # rho01 = <0|rho|1> = r * exp(-i*phi)
                 # 相位 phi = arg(rho01)
                 rho01 = rho_i[0, 1]
-                phase = -np.angle(rho01) if abs(rho01) > 1e-6 else 0
                 
-                radius = np.sqrt(prob1)
+                # 处于 |0⟩ 的比特无需绘制指针
+                ground = bool(prob1 < 1e-6 and abs(rho01) < 1e-6)
+                self._set_ground(i, ground)
+                if ground:
+                    continue
                 
-                # 绘制相位指针
-                ax.annotate("", xy=(phase, radius), xytext=(0, 0),
-                            arrowprops=dict(arrowstyle="->", color='#4A90E2', lw=3))
+                phase = -np.angle(rho01) if abs(rho01) > 1e-6 else 0
+                radius = np.sqrt(prob1)
                 
-                # 绘制圆盘背景 (代表概率幅)
-                circle = plt.Circle((0, 0), 1.0, transform=ax.transData._b, color='#4A90E2', alpha=0.1)
-                ax.add_artist(circle)
+                # 更新相位指针
+                self.arrows[i].set_data([phase, phase], [0, radius])
                 
             except Exception as e:
                 print(f"Phase disk error for q{i}: {e}")
+                self._last_rho[i] = None
+                self._set_ground(i, False)
+                self.arrows[i].set_data([0, 0], [0, 0])
+                changed = True
             
-            ax.set_ylim(0, 1)
-            ax.set_title(f"q{i}", fontsize=11, fontweight='bold', color='#2C3E50')
-            ax.set_yticklabels([])
-            ax.set_xticklabels([])
-            ax.grid(True, alpha=0.1)
-            
-        self.figure.tight_layout()
-        self.draw()
+        if changed:
+            self.draw_idle()
         
     def clear(self):
         self.figure.clear()
+        self.disk_axes = []
+        self.arrows = []
+        self.backgrounds = []
+        self.ground_labels = []
+        self._last_rho = []
         self.draw()
 
 
@@ -312,37 +533,45 @@ class StateVectorView(QWidget):
         
         layout.addWidget(self.label)
         
-    def update_state(self, state):
-        """更新态向量显示"""
-        vec = state.get_statevector()
+    def update_state(self, state, vec=None, probs=None):
+        """更新态向量显示
+        
+        vec/probs: 可选的预计算态向量与概率数组，省略时从 state 计算
+        """
+        if vec is None:
+            vec = state.get_statevector()
+        if probs is None:
+            probs = state.probabilities_array
         num_qubits = state.num_qubits
         
-        # 构建显示文本
-        text = f"<h3>{num_qubits}量子比特态向量</h3>"
-        text += "<table style='font-family: monospace;'>"
-        text += "<tr><th>基态</th><th>振幅</th><th>概率</th></tr>"
-        
-        # 只显示非零或前10个
-        count = 0
-        for i, amp in enumerate(vec):
-            prob = abs(amp) ** 2
-            if prob > 1e-6 or (count < 10 and i < len(vec)):
-                basis = f"|{i:0{num_qubits}b}⟩"
-                amp_str = f"{amp.real:.4f}{amp.imag:+.4f}i"
-                prob_str = f"{prob:.4f}"
-                
-                text += f"<tr><td>{basis}</td><td>{amp_str}</td><td>{prob_str}</td></tr>"
-                count += 1
-                
-                if count >= 10:
-                    break
+        # 构建显示文本 (按行收集后一次性拼接)
+        parts = [
+            f"<h3>{num_qubits}量子比特态向量</h3>",
+            "<table style='font-family: monospace;'>",
+            "<tr><th>基态</th><th>振幅</th><th>概率</th></tr>",
+        ]
+        
+        # 只显示非零项 (最多10个)
+        shown = np.flatnonzero(probs > 1e-6)[:10]
+        if len(shown) == 0:
+            shown = np.arange(min(10, len(vec)))
+        count = len(shown)
+        
+        amps = vec[shown]
+        bases = _binary_labels(shown, num_qubits)
+        amp_strs = np.char.add(np.char.mod('%.4f', amps.real), np.char.mod('%+.4fi', amps.imag))
+        prob_strs = np.char.mod('%.4f', probs[shown])
+        parts.extend(
+            f"<tr><td>{basis}</td><td>{amp_str}</td><td>{prob_str}</td></tr>"
+            for basis, amp_str, prob_str in zip(bases, amp_strs.tolist(), prob_strs.tolist())
+        )
         
         if len(vec) > count:
-            text += f"<tr><td colspan='3'>... 还有 {len(vec) - count} 项</td></tr>"
+            parts.append(f"<tr><td colspan='3'>... 还有 {len(vec) - count} 项</td></tr>")
         
-        text += "</table>"
+        parts.append("</table>")
         
-        self.label.setText(text)
+        self.label.setText("".join(parts))
     
     def clear(self):
         """清空显示"""
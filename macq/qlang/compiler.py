@@ -3,18 +3,119 @@ Q-Lang Compiler
 Converts Q-Lang AST to visual circuit representation
 """
 
-from typing import List, Dict, Any
+import math
+from functools import lru_cache
+from itertools import chain
+from typing import List, Dict, Any, Mapping, NamedTuple, Optional
 from .parser import (
     Program, TimeStep, GateOperation,
     SingleQubitGate, TwoQubitGate, ThreeQubitGate,
-    MeasurementNode, ConditionalNode, ModularGate, QFTNode, QubitsNode
+    MeasurementNode, ConditionalNode, ModularGate, QFTNode,
+    PARAMETRIC_GATES, TWO_QUBIT_GATES
 )
 
 
+# Common fractions of π recognised by the decompiler, checked in order
+_PI = math.pi
+_PI_2 = _PI / 2
+_PI_4 = _PI / 4
+_ANGLE_TABLE = ((_PI_2, "π/2"), (_PI_4, "π/4"), (_PI, "π"))
+
+class _EmptyParams(dict):
+    """
+    Read-only empty dict shared as params by every parameterless gate.
+    
+    Being a real dict, it still copies, pickles and serializes to JSON like
+    the legacy per-gate {}; copies and unpickling return the shared object.
+    """
+    __slots__ = ()
+    
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("params of compiled gates are read-only")
+    
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+    
+    def __copy__(self):
+        return self
+    
+    def __deepcopy__(self, memo):
+        return self
+    
+    def __reduce__(self):
+        return '_EMPTY_PARAMS'
+
+
+# Shared params for gates without parameters (one object for all of them
+# instead of a fresh {} per gate). Consumers must not mutate params.
+_EMPTY_PARAMS: Mapping[str, Any] = _EmptyParams()
+
+
+class Gate(NamedTuple):
+    """
+    Compiled gate record.
+    
+    A tuple-backed replacement for the per-gate dict, several times smaller
+    in memory. It reads like the legacy compiler dicts: gate['type'],
+    gate.get('control'), 'control2' in gate, keys()/values()/items() and
+    dict(gate) all behave as they did, with control2 present only when set
+    (as on three-qubit gates). Being a tuple, iterating or unpacking a Gate
+    yields its field values in order, and json.dumps() encodes it as a
+    list; use dict(gate) where a real dict is needed.
+    """
+    type: str
+    qubit: int
+    time_step: int
+    control: Optional[int]
+    control2: Optional[int]
+    params: Mapping[str, Any]  # read-only; may be the shared _EMPTY_PARAMS
+    
+    def __getitem__(self, key):
+        if key.__class__ is str:
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """dict.get equivalent"""
+        return getattr(self, key) if key in self else default
+    
+    def __contains__(self, key) -> bool:
+        # Mirror the legacy dict keys: control is always present (possibly
+        # None), control2 only on gates that have a second control
+        if key == 'control2':
+            return self.control2 is not None
+        return key in self._fields
+    
+    def keys(self) -> List[str]:
+        """dict.keys equivalent (also makes dict(gate) work)"""
+        if self.control2 is None:
+            return ['type', 'qubit', 'time_step', 'control', 'params']
+        return list(self._fields)
+    
+    def values(self) -> List[Any]:
+        """dict.values equivalent"""
+        return [getattr(self, key) for key in self.keys()]
+    
+    def items(self) -> List[tuple]:
+        """dict.items equivalent"""
+        return [(key, getattr(self, key)) for key in self.keys()]
+
+
+@lru_cache(maxsize=1024)
+def _format_angle(angle: float) -> str:
+    """Format an angle for Q-Lang, preferring common fractions of π"""
+    for value, label in _ANGLE_TABLE:
+        if abs(angle - value) < 0.001:
+            return label
+    return f"{angle:.6f}".rstrip('0').rstrip('.')
+
+
 class QLangCompiler:
     """Compiler: Q-Lang AST → Circuit gates"""
     
-    def compile(self, program: Program) -> List[Dict[str, Any]]:
+    def compile(self, program: Program) -> List[Gate]:
         """
         Compile Q-Lang program to circuit gate list
         
@@ -22,136 +123,139 @@ class QLangCompiler:
             program: Parsed and validated Q-Lang program
             
         Returns:
-            List of gate dictionaries compatible with CircuitEditorWidget
-            Format: {'type': str, 'qubit': int, 'time_step': int, 
-                     'control': int, 'params': dict}
+            List of Gate records compatible with CircuitEditorWidget
+            Fields: type, qubit, time_step, control, control2, params
+            
+            Gate records replace the plain dicts earlier versions returned.
+            Lookups (gate['type'], get, in, keys/items, dict(gate)) match
+            the old dicts, but a Gate is an immutable tuple: iteration and
+            json.dumps() see its field values, and fields cannot be
+            assigned (use gate._replace(...) or dict(gate)).
         """
-        gates = []
-        
-        for time_step_idx, time_step in enumerate(program.time_steps):
-            for operation in time_step.operations:
-                compiled_gates = self._compile_operation(operation, time_step_idx)
-                gates.extend(compiled_gates)
+        if not program.time_steps:
+            return []
         
-        return gates
+        return list(chain.from_iterable(
+            self._compile_operation(operation, time_step_idx)
+            for time_step_idx, time_step in enumerate(program.time_steps)
+            for operation in time_step.operations
+        ))
     
     def _compile_operation(self, operation: GateOperation, 
-                          time_step: int) -> List[Dict[str, Any]]:
-        """Compile a single operation to gate dict(s)"""
-        
-        if isinstance(operation, SingleQubitGate):
-            return self._compile_single_qubit_gate(operation, time_step)
-        elif isinstance(operation, TwoQubitGate):
-            return [self._compile_two_qubit_gate(operation, time_step)]
-        elif isinstance(operation, ThreeQubitGate):
-            return [self._compile_three_qubit_gate(operation, time_step)]
-        elif isinstance(operation, MeasurementNode):
-            return [self._compile_measurement(operation, time_step)]
-        elif isinstance(operation, ConditionalNode):
-            # For now, compile the inner operation with a note
-            # Full runtime conditional support needs C engine update
-            return self._compile_operation(operation.operation, time_step)
-        elif isinstance(operation, ModularGate):
-            return [self._compile_modular_gate(operation, time_step)]
-        elif isinstance(operation, QFTNode):
-            return [self._compile_qft(operation, time_step)]
-        elif isinstance(operation, QubitsNode):
+                          time_step: int) -> List[Gate]:
+        """Compile a single operation to Gate record(s)"""
+        # One dict probe on the node class instead of an isinstance cascade
+        compile_fn = self._COMPILE_DISPATCH.get(operation.__class__)
+        if compile_fn is None:
+            # QubitsNode (and unknown nodes) emit no gates
             return []
         
-        return []
+        result = compile_fn(self, operation, time_step)
+        return result if result.__class__ is list else [result]
+    
+    def _compile_conditional(self, node: ConditionalNode,
+                             time_step: int) -> List[Gate]:
+        """Compile conditional operation"""
+        # For now, compile the inner operation with a note
+        # Full runtime conditional support needs C engine update
+        return self._compile_operation(node.operation, time_step)
     
     def _compile_single_qubit_gate(self, gate: SingleQubitGate, 
-                                   time_step: int) -> List[Dict[str, Any]]:
+                                   time_step: int) -> List[Gate]:
         """Compile single-qubit gate (may apply to multiple qubits)"""
-        gates = []
+        gate_name = gate.gate_name
         
-        for qubit in gate.qubits:
-            gate_dict = {
-                'type': gate.gate_name,
-                'qubit': qubit,
-                'time_step': time_step,
-                'control': None,
-                'params': {}
-            }
-            
-            # Add parameter if present
-            if gate.parameter:
-                try:
-                    param_value = gate.parameter.evaluate()
-                    gate_dict['params']['angle'] = param_value
-                except ValueError:
-                    # Keep original expression if evaluation fails
-                    gate_dict['params']['angle'] = gate.parameter.expression
-            
-            gates.append(gate_dict)
+        if not gate.parameter:
+            return [
+                Gate(gate_name, qubit, time_step, None, None, _EMPTY_PARAMS)
+                for qubit in gate.qubits
+            ]
+        
+        # Evaluate the parameter once for all target qubits
+        try:
+            angle = gate.parameter.evaluate()
+        except ValueError:
+            # Keep original expression if evaluation fails
+            angle = gate.parameter.expression
         
-        return gates
+        return [
+            Gate(gate_name, qubit, time_step, None, None, {'angle': angle})
+            for qubit in gate.qubits
+        ]
     
     def _compile_two_qubit_gate(self, gate: TwoQubitGate, 
-                               time_step: int) -> Dict[str, Any]:
+                               time_step: int) -> Gate:
         """Compile two-qubit gate"""
-        return {
-            'type': gate.gate_name,
-            'qubit': gate.target,
-            'time_step': time_step,
-            'control': gate.control,
-            'params': {}
-        }
+        return Gate(gate.gate_name, gate.target, time_step, gate.control, None, _EMPTY_PARAMS)
     
     def _compile_three_qubit_gate(self, gate: ThreeQubitGate, 
-                                  time_step: int) -> Dict[str, Any]:
+                                  time_step: int) -> Gate:
         """Compile three-qubit gate (Toffoli, CCZ)"""
-        return {
-            'type': gate.gate_name,
-            'qubit': gate.target,
-            'time_step': time_step,
-            'control': gate.control1,  # Store first control
-            'control2': gate.control2,  # Store second control
-            'params': {}
-        }
+        return Gate(
+            type=gate.gate_name,
+            qubit=gate.target,
+            time_step=time_step,
+            control=gate.control1,  # Store first control
+            control2=gate.control2,  # Store second control
+            params=_EMPTY_PARAMS
+        )
     
     def _compile_measurement(self, node: MeasurementNode, 
-                           time_step: int) -> Dict[str, Any]:
+                           time_step: int) -> Gate:
         """Compile measurement operation"""
-        return {
-            'type': 'MEASURE',
-            'qubit': node.qubit,
-            'time_step': time_step,
-            'control': None,
-            'params': {
+        return Gate(
+            type='MEASURE',
+            qubit=node.qubit,
+            time_step=time_step,
+            control=None,
+            control2=None,
+            params={
                 'classical_bit': node.classical_bit
             }
-        }
+        )
     
     def _compile_modular_gate(self, gate: ModularGate, 
-                             time_step: int) -> Dict[str, Any]:
+                             time_step: int) -> Gate:
         """Compile modular arithmetic gate"""
-        return {
-            'type': gate.gate_name,
-            'qubit': gate.target_qubits[0] if gate.target_qubits else 0,
-            'time_step': time_step,
-            'control': gate.control_qubits[0] if gate.control_qubits else None,
-            'params': {
+        return Gate(
+            type=gate.gate_name,
+            qubit=gate.target_qubits[0] if gate.target_qubits else 0,
+            time_step=time_step,
+            control=gate.control_qubits[0] if gate.control_qubits else None,
+            control2=None,
+            params={
                 'base': gate.base,
                 'modulus': gate.modulus,
                 'control_qubits': gate.control_qubits,
                 'target_qubits': gate.target_qubits
             }
-        }
+        )
     
     def _compile_qft(self, node: QFTNode, 
-                    time_step: int) -> Dict[str, Any]:
+                    time_step: int) -> Gate:
         """Compile QFT operation"""
-        return {
-            'type': 'QFT_INV' if node.is_inverse else 'QFT',
-            'qubit': node.qubits[0] if node.qubits else 0,
-            'time_step': time_step,
-            'control': None,
-            'params': {
+        return Gate(
+            type='QFT_INV' if node.is_inverse else 'QFT',
+            qubit=node.qubits[0] if node.qubits else 0,
+            time_step=time_step,
+            control=None,
+            control2=None,
+            params={
                 'qubits': node.qubits,
                 'is_inverse': node.is_inverse
             }
-        }
+        )
+    
+    # AST node class -> compile method (returns a Gate or a list of Gates)
+    _COMPILE_DISPATCH = {
+        SingleQubitGate: _compile_single_qubit_gate,
+        TwoQubitGate: _compile_two_qubit_gate,
+        ThreeQubitGate: _compile_three_qubit_gate,
+        MeasurementNode: _compile_measurement,
+        ConditionalNode: _compile_conditional,
+        ModularGate: _compile_modular_gate,
+        QFTNode: _compile_qft,
+    }
 
 
 class QLangDecompiler:
@@ -163,7 +267,7 @@ class QLangDecompiler:
         Decompile circuit gates to Q-Lang code
         
         Args:
-            gates: List of gate dictionaries from CircuitEditorWidget
+            gates: List of gate dicts from CircuitEditorWidget or Gate records
             num_qubits: Optional number of qubits (for validation)
             
         Returns:
@@ -172,45 +276,37 @@ class QLangDecompiler:
         if not gates:
             return "# Empty circuit\n"
         
-        # Group gates by time step
-        time_steps: Dict[int, List[Dict[str, Any]]] = {}
-        for gate in gates:
-            ts = gate['time_step']
-            if ts not in time_steps:
-                time_steps[ts] = []
-            time_steps[ts].append(gate)
-        
-        # Generate code
-        lines = []
-        lines.append("# Generated Q-Lang code")
-        lines.append("")
+        # Single time step (common for small edits/previews): no bucketing
+        first_ts = gates[0]['time_step']
+        if all(gate['time_step'] == first_ts for gate in gates):
+            return "# Generated Q-Lang code\n\n" + "; ".join(map(self._decompile_gate, gates))
         
-        # Sort by time step
-        for ts in sorted(time_steps.keys()):
-            gates_in_step = time_steps[ts]
-            
-            # Group by gate type and qubits for compact representation
-            statements = []
-            
-            for gate in gates_in_step:
-                statement = self._decompile_gate(gate)
-                statements.append(statement)
-            
-            # Join statements with semicolons
-            line = "; ".join(statements)
-            lines.append(line)
+        # Group gates by time step (time steps are small non-negative
+        # integers, so a list of buckets replaces hashing and sorting)
+        max_ts = max(gate['time_step'] for gate in gates)
+        time_steps: List[List[Dict[str, Any]]] = [[] for _ in range(max_ts + 1)]
+        for gate in gates:
+            time_steps[gate['time_step']].append(gate)
         
-        return "\n".join(lines)
+        # Generate code in a single join: one line per non-empty time step
+        # (buckets are already in time step order), statements joined with
+        # semicolons
+        decompile_gate = self._decompile_gate
+        lines = (
+            "; ".join(map(decompile_gate, gates_in_step))
+            for gates_in_step in time_steps
+            if gates_in_step
+        )
+        return "\n".join(chain(("# Generated Q-Lang code", ""), lines))
     
     def _decompile_gate(self, gate: Dict[str, Any]) -> str:
         """Decompile a single gate to Q-Lang syntax"""
         gate_type = gate['type']
         qubit = gate['qubit']
         control = gate.get('control')
-        params = gate.get('params', {})
         
         # Two-qubit gates
-        if control is not None and gate_type in ['CNOT', 'CZ', 'SWAP', 'CX']:
+        if control is not None and gate_type in TWO_QUBIT_GATES:
             return f"{gate_type} {control}-{qubit}"
         
         # Three-qubit gates
@@ -219,20 +315,11 @@ class QLangDecompiler:
             return f"{gate_type} {control}-{control2}-{qubit}"
         
         # Parametric single-qubit gates
-        if gate_type in ['Rx', 'Ry', 'Rz'] and 'angle' in params:
-            angle = params['angle']
+        if gate_type in PARAMETRIC_GATES and 'angle' in gate.get('params', ()):
+            angle = gate['params']['angle']
             # Format angle nicely
             if isinstance(angle, float):
-                # Check for common fractions of π
-                import math
-                if abs(angle - math.pi/2) < 0.001:
-                    angle_str = "π/2"
-                elif abs(angle - math.pi/4) < 0.001:
-                    angle_str = "π/4"
-                elif abs(angle - math.pi) < 0.001:
-                    angle_str = "π"
-                else:
-                    angle_str = f"{angle:.6f}".rstrip('0').rstrip('.')
+                angle_str = _format_angle(angle)
             else:
                 angle_str = str(angle)
             
@@ -3,8 +3,14 @@ Q-Lang Parser
 Syntax analysis and AST construction for quantum circuit description language
 """
 
-from dataclasses import dataclass
-from typing import List, Optional, Union
+import ast
+import math
+import operator
+from collections import OrderedDict
+from functools import lru_cache
+from hashlib import blake2b
+from itertools import chain
+from typing import Iterable, List, Optional, Union
 from .tokenizer import Token, TokenType, QLangTokenizer
 
 
@@ -12,16 +18,72 @@ from .tokenizer import Token, TokenType, QLangTokenizer
 # AST Node Definitions
 # ============================================================================
 
-@dataclass
 class ASTNode:
-    """Base class for all AST nodes"""
+    """Base class for all AST nodes (slotted: no per-instance __dict__)"""
+    __slots__ = ('line', 'column')
     line: int
     column: int
 
+    def __init__(self, line: int = 0, column: int = 0):
+        self.line = line
+        self.column = column
+
+    @classmethod
+    def _field_names(cls) -> List[str]:
+        """Slot names in declaration order (base class first), minus private caches"""
+        names = []
+        for klass in reversed(cls.__mro__):
+            names.extend(name for name in klass.__dict__.get('__slots__', ())
+                         if not name.startswith('_'))
+        return names
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name)
+                   for name in self._field_names())
+
+    __hash__ = None
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._field_names())
+        return f"{self.__class__.__name__}({fields})"
+
+    def qubit_mask(self) -> int:
+        """Bitmask of the qubits this node acts on (bit q = qubit q)"""
+        return 0
+
+
+def _qubits_to_mask(qubits) -> int:
+    """Bitmask with bit q set for every (non-negative) qubit index q"""
+    mask = 0
+    for qubit in qubits:
+        mask |= 1 << qubit
+    return mask
+
+
+class OperationNode(ASTNode):
+    """Base class for operations that act on qubits inside a time step.
+
+    The qubit mask is computed on first use and memoized; nodes are not
+    expected to change after parsing (parsed ASTs are already shared via
+    the parser cache).
+    """
+    __slots__ = ('_qubit_mask',)
+
+    def _involved_qubits(self) -> Iterable[int]:
+        raise NotImplementedError
+
+    def qubit_mask(self) -> int:
+        mask = self._qubit_mask
+        if mask is None:
+            mask = self._qubit_mask = _qubits_to_mask(self._involved_qubits())
+        return mask
+
 
-@dataclass
 class QubitsNode(ASTNode):
     """qubits N directive"""
+    __slots__ = ('count',)
     count: int
     
     def __init__(self, count: int, line: int = 0, column: int = 0):
@@ -33,31 +95,69 @@ class QubitsNode(ASTNode):
         return f"qubits {self.count}"
 
 
-@dataclass
 class Parameter(ASTNode):
     """Parameter for parametric gates (e.g., π/4, 0.5)"""
+    __slots__ = ('expression', '_value')
     expression: str
     
     def __init__(self, expression: str, line: int = 0, column: int = 0):
         self.expression = expression
         self.line = line
         self.column = column
+        self._value = None  # memoized result of evaluate()
     
     def evaluate(self) -> float:
-        """Evaluate parameter expression"""
-        import math
-        # Replace π with pi
-        expr = self.expression.replace('π', str(math.pi))
-        expr = expr.replace('pi', str(math.pi))
-        try:
-            return eval(expr)
-        except Exception as e:
-            raise ValueError(f"Invalid parameter expression '{self.expression}': {e}")
-
-
-@dataclass
-class MeasurementNode(ASTNode):
+        """Evaluate parameter expression (computed once per Parameter)"""
+        value = self._value
+        if value is None:
+            try:
+                value = _evaluate_expression(self.expression)
+            except Exception as e:
+                raise ValueError(f"Invalid parameter expression '{self.expression}': {e}")
+            self._value = value
+        return value
+
+
+# Arithmetic allowed in parameter expressions
+_BINARY_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Pow: operator.pow,
+}
+_UNARY_OPS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+
+def _eval_node(node: ast.AST) -> float:
+    """Evaluate a parsed parameter expression (numbers and + - * / ** only)"""
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPS:
+        return _BINARY_OPS[type(node.op)](_eval_node(node.left), _eval_node(node.right))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPS:
+        return _UNARY_OPS[type(node.op)](_eval_node(node.operand))
+    if isinstance(node, ast.Name):
+        raise NameError(f"name '{node.id}' is not defined")
+    raise ValueError(f"unsupported syntax '{ast.dump(node)}'")
+
+
+@lru_cache(maxsize=256)
+def _evaluate_expression(expression: str) -> float:
+    """Evaluate a parameter expression such as 'π/4' without eval()"""
+    # Replace π with pi
+    expr = expression.replace('π', str(math.pi))
+    expr = expr.replace('pi', str(math.pi))
+    tree = ast.parse(expr, filename='<string>', mode='eval')
+    return _eval_node(tree.body)
+
+
+class MeasurementNode(OperationNode):
     """Measurement operation: measure qubit -> classical_bit"""
+    __slots__ = ('qubit', 'classical_bit')
     qubit: int
     classical_bit: str  # Name of classical bit (e.g., "c0", "c1")
     
@@ -66,22 +166,25 @@ class MeasurementNode(ASTNode):
         self.classical_bit = classical_bit
         self.line = line
         self.column = column
+        self._qubit_mask = None
+    
+    def _involved_qubits(self) -> Iterable[int]:
+        return (self.qubit,)
     
     def __repr__(self):
         return f"measure {self.qubit} -> {self.classical_bit}"
 
 
-@dataclass
 class Condition(ASTNode):
     """Condition expression for classical control"""
-    pass
+    __slots__ = ()
 
 
-@dataclass
 class BitCondition(Condition):
     """Simple bit condition: c0 or c0 == 1 or c0 == 0"""
+    __slots__ = ('bit_name', 'expected_value')
     bit_name: str
-    expected_value: Optional[int] = None  # None means "if c0" (equivalent to c0 == 1)
+    expected_value: Optional[int]  # None means "if c0" (equivalent to c0 == 1)
     
     def __init__(self, bit_name: str, expected_value: Optional[int] = None, 
                  line: int = 0, column: int = 0):
@@ -96,9 +199,9 @@ class BitCondition(Condition):
         return f"{self.bit_name} == {self.expected_value}"
 
 
-@dataclass
 class AndCondition(Condition):
     """Logical AND of conditions"""
+    __slots__ = ('left', 'right')
     left: Condition
     right: Condition
     
@@ -112,9 +215,9 @@ class AndCondition(Condition):
         return f"({self.left} and {self.right})"
 
 
-@dataclass
 class OrCondition(Condition):
     """Logical OR of conditions"""
+    __slots__ = ('left', 'right')
     left: Condition
     right: Condition
     
@@ -128,9 +231,9 @@ class OrCondition(Condition):
         return f"({self.left} or {self.right})"
 
 
-@dataclass
-class ConditionalNode(ASTNode):
+class ConditionalNode(OperationNode):
     """Conditional gate operation: if condition then operation"""
+    __slots__ = ('condition', 'operation')
     condition: Condition
     operation: 'GateOperation'  # Forward reference
     
@@ -141,13 +244,16 @@ class ConditionalNode(ASTNode):
         self.line = line
         self.column = column
     
+    def qubit_mask(self) -> int:
+        return self.operation.qubit_mask()
+    
     def __repr__(self):
         return f"if {self.condition} then {self.operation}"
 
 
-@dataclass
-class ModularGate(ASTNode):
+class ModularGate(OperationNode):
     """Modular arithmetic gate: MOD_EXP(a, N) control-target"""
+    __slots__ = ('gate_name', 'base', 'modulus', 'control_qubits', 'target_qubits')
     gate_name: str  # MOD_EXP, MOD_ADD, MOD_MUL
     base: int  # Base for exponentiation (a in a^x mod N)
     modulus: int  # Modulus N
@@ -164,6 +270,10 @@ class ModularGate(ASTNode):
         self.target_qubits = target_qubits
         self.line = line
         self.column = column
+        self._qubit_mask = None
+    
+    def _involved_qubits(self) -> Iterable[int]:
+        return chain(self.control_qubits, self.target_qubits)
     
     def __repr__(self):
         ctrl = ','.join(map(str, self.control_qubits))
@@ -171,9 +281,9 @@ class ModularGate(ASTNode):
         return f"{self.gate_name}({self.base},{self.modulus}) {ctrl}-{tgt}"
 
 
-@dataclass
-class QFTNode(ASTNode):
+class QFTNode(OperationNode):
     """Quantum Fourier Transform: QFT or QFT_INV on register"""
+    __slots__ = ('is_inverse', 'qubits')
     is_inverse: bool  # True for QFT_INV, False for QFT
     qubits: List[int]  # Qubits to apply QFT to
     
@@ -183,6 +293,10 @@ class QFTNode(ASTNode):
         self.qubits = qubits
         self.line = line
         self.column = column
+        self._qubit_mask = None
+    
+    def _involved_qubits(self) -> Iterable[int]:
+        return self.qubits
     
     def __repr__(self):
         name = "QFT_INV" if self.is_inverse else "QFT"
@@ -190,12 +304,12 @@ class QFTNode(ASTNode):
         return f"{name} {qubits_str}"
 
 
-@dataclass
-class SingleQubitGate(ASTNode):
+class SingleQubitGate(OperationNode):
     """Single-qubit gate operation"""
+    __slots__ = ('gate_name', 'qubits', 'parameter')
     gate_name: str
     qubits: List[int]
-    parameter: Optional[Parameter] = None
+    parameter: Optional[Parameter]
     
     def __init__(self, gate_name: str, qubits: List[int], parameter: Optional[Parameter] = None, 
                  line: int = 0, column: int = 0):
@@ -204,6 +318,10 @@ class SingleQubitGate(ASTNode):
         self.parameter = parameter
         self.line = line
         self.column = column
+        self._qubit_mask = None
+    
+    def _involved_qubits(self) -> Iterable[int]:
+        return self.qubits
     
     def __repr__(self):
         param_str = f"({self.parameter.expression})" if self.parameter else ""
@@ -211,9 +329,9 @@ class SingleQubitGate(ASTNode):
         return f"{self.gate_name}{param_str} {qubits_str}"
 
 
-@dataclass
-class TwoQubitGate(ASTNode):
+class TwoQubitGate(OperationNode):
     """Two-qubit gate operation (CNOT, CZ, SWAP)"""
+    __slots__ = ('gate_name', 'control', 'target')
     gate_name: str
     control: int
     target: int
@@ -224,14 +342,18 @@ class TwoQubitGate(ASTNode):
         self.target = target
         self.line = line
         self.column = column
+        self._qubit_mask = None
+    
+    def _involved_qubits(self) -> Iterable[int]:
+        return (self.control, self.target)
     
     def __repr__(self):
         return f"{self.gate_name} {self.control}-{self.target}"
 
 
-@dataclass
-class ThreeQubitGate(ASTNode):
+class ThreeQubitGate(OperationNode):
     """Three-qubit gate operation (Toffoli, CCZ)"""
+    __slots__ = ('gate_name', 'control1', 'control2', 'target')
     gate_name: str
     control1: int
     control2: int
@@ -245,6 +367,10 @@ class ThreeQubitGate(ASTNode):
         self.target = target
         self.line = line
         self.column = column
+        self._qubit_mask = None
+    
+    def _involved_qubits(self) -> Iterable[int]:
+        return (self.control1, self.control2, self.target)
     
     def __repr__(self):
         return f"{self.gate_name} {self.control1}-{self.control2}-{self.target}"
@@ -254,9 +380,9 @@ class ThreeQubitGate(ASTNode):
 GateOperation = Union[SingleQubitGate, TwoQubitGate, ThreeQubitGate, MeasurementNode, ConditionalNode, ModularGate, QFTNode, QubitsNode]
 
 
-@dataclass
 class TimeStep(ASTNode):
     """Represents a single time step with parallel operations"""
+    __slots__ = ('operations',)
     operations: List[GateOperation]
     
     def __init__(self, operations: List[GateOperation], line: int = 0, column: int = 0):
@@ -269,11 +395,11 @@ class TimeStep(ASTNode):
         return f"TimeStep({ops_str})"
 
 
-@dataclass
 class Program(ASTNode):
     """Root node representing entire Q-Lang program"""
+    __slots__ = ('time_steps', 'num_qubits')
     time_steps: List[TimeStep]
-    num_qubits: Optional[int] = None
+    num_qubits: Optional[int]
     
     def __init__(self, time_steps: List[TimeStep], num_qubits: Optional[int] = None, 
                  line: int = 0, column: int = 0):
@@ -287,6 +413,29 @@ class Program(ASTNode):
         return f"Program(\n{steps_str}\n)"
 
 
+# ============================================================================
+# Gate Classification
+# ============================================================================
+
+# Gates that require parameters
+PARAMETRIC_GATES = frozenset({'Rx', 'Ry', 'Rz'})
+
+# Multi-qubit gates
+TWO_QUBIT_GATES = frozenset({'CNOT', 'CZ', 'SWAP', 'CX'})
+THREE_QUBIT_GATES = frozenset({'Toffoli', 'CCZ', 'CCNOT'})
+
+# Modular arithmetic gates (v2.0)
+MODULAR_GATES = frozenset({'MOD_EXP', 'MOD_ADD', 'MOD_MUL'})
+
+# Built-in transforms (v2.0)
+QFT_GATES = frozenset({'QFT', 'QFT_INV'})
+
+
+# Operand token shapes for fixed-arity gates (qubit numbers joined by dashes)
+_TWO_QUBIT_SHAPE = (TokenType.NUMBER, TokenType.DASH, TokenType.NUMBER)
+_THREE_QUBIT_SHAPE = _TWO_QUBIT_SHAPE + (TokenType.DASH, TokenType.NUMBER)
+
+
 # ============================================================================
 # Parser Implementation
 # ============================================================================
@@ -294,21 +443,37 @@ class Program(ASTNode):
 class QLangParser:
     """Parser for Q-Lang"""
     
-    # Gates that require parameters
-    PARAMETRIC_GATES = {'Rx', 'Ry', 'Rz'}
-    
-    # Multi-qubit gates
-    TWO_QUBIT_GATES = {'CNOT', 'CZ', 'SWAP', 'CX'}
-    THREE_QUBIT_GATES = {'Toffoli', 'CCZ', 'CCNOT'}
-    
-    # Modular arithmetic gates (v2.0)
-    MODULAR_GATES = {'MOD_EXP', 'MOD_ADD', 'MOD_MUL'}
-    
-    # Built-in transforms (v2.0)
-    QFT_GATES = {'QFT', 'QFT_INV'}
+    # Gate classification (aliases of the module-level frozensets)
+    PARAMETRIC_GATES = PARAMETRIC_GATES
+    TWO_QUBIT_GATES = TWO_QUBIT_GATES
+    THREE_QUBIT_GATES = THREE_QUBIT_GATES
+    MODULAR_GATES = MODULAR_GATES
+    QFT_GATES = QFT_GATES
+    
+    # Gate name -> parse kind, resolved with a single dict lookup per gate.
+    # Names not listed here are plain single-qubit gates.
+    _GATE_DISPATCH = {
+        **dict.fromkeys(PARAMETRIC_GATES, 'parametric'),
+        **dict.fromkeys(TWO_QUBIT_GATES, 'two'),
+        **dict.fromkeys(THREE_QUBIT_GATES, 'three'),
+        **dict.fromkeys(MODULAR_GATES, 'modular'),
+        **dict.fromkeys(QFT_GATES, 'qft'),
+    }
+    
+    # The tokenizer holds only its compiled regex, so one instance is shared
+    # by every parser instead of being rebuilt per parser
+    _shared_tokenizer: Optional[QLangTokenizer] = None
+    
+    # Parsed programs keyed by a digest of their source, shared by all parsers
+    # (the editor and Circuit.from_qlang re-submit identical code often).
+    # Cached ASTs are shared objects and must be treated as read-only.
+    AST_CACHE_SIZE = 256
+    _ast_cache: 'OrderedDict[bytes, Program]' = OrderedDict()
     
     def __init__(self):
-        self.tokenizer = QLangTokenizer()
+        if QLangParser._shared_tokenizer is None:
+            QLangParser._shared_tokenizer = QLangTokenizer()
+        self.tokenizer = QLangParser._shared_tokenizer
         self.tokens = []
         self.pos = 0
     
@@ -320,11 +485,96 @@ class QLangParser:
             code: Q-Lang source code
             
         Returns:
-            Program AST node
+            Program AST node (shared with other callers parsing the same
+            source; do not mutate it)
+        """
+        return self._parse_source(code, None)
+    
+    def parse_and_validate(self, code: str, num_qubits: int) -> Program:
         """
+        Parse Q-Lang source code and validate it in the same pass
+        
+        Each time step is validated as soon as it is parsed, so a large
+        program is not walked a second time. Unlike parse() followed by
+        QLangValidator.validate(), a validation error on an early line is
+        reported before a syntax error on a later one.
+        
+        Args:
+            code: Q-Lang source code
+            num_qubits: Total number of available qubits
+            
+        Returns:
+            Program AST node (shared, as for parse())
+            
+        Raises:
+            SyntaxError: If the source does not parse
+            ValidationError: If the program is invalid for num_qubits
+        """
+        from .validator import QLangValidator
+        return self._parse_source(code, QLangValidator(num_qubits))
+    
+    def _parse_source(self, code: str, validator) -> Program:
+        """parse(), validating with validator (if not None) on the way"""
+        key = blake2b(code.encode('utf-8'), digest_size=16).digest()
+        cache = QLangParser._ast_cache
+        program = cache.get(key)
+        if program is not None:
+            cache.move_to_end(key)
+            if validator is not None:
+                validator.validate(program)
+            return program
+        
         # Tokenize
-        self.tokens = self.tokenizer.tokenize(code)
-        self.tokens = self.tokenizer.filter_comments(self.tokens)
+        tokens = self.tokenizer.tokenize(code)
+        tokens = self.tokenizer.filter_comments(tokens)
+        
+        # Second chance: sources whose comment-free token streams match
+        # (e.g. only a comment was edited) produce identical ASTs
+        canonical_key = self._canonical_key(tokens)
+        program = cache.get(canonical_key)
+        if program is None:
+            program = self._parse_tokens(tokens, validator)
+            self._cache_store(canonical_key, program)
+        else:
+            cache.move_to_end(canonical_key)
+            if validator is not None:
+                validator.validate(program)
+        self._cache_store(key, program)
+        return program
+    
+    @staticmethod
+    def _canonical_key(tokens: List[Token]) -> bytes:
+        """
+        Digest of a comment-free token stream.
+        
+        Token positions are part of the key because AST nodes record them;
+        NEWLINE columns are not (only trailing whitespace moves them).
+        """
+        NEWLINE = TokenType.NEWLINE
+        canonical = '\x1f'.join(
+            f"{t.type.name}\x1e{t.value}\x1e{t.line}"
+            if t.type == NEWLINE else
+            f"{t.type.name}\x1e{t.value}\x1e{t.line}\x1e{t.column}"
+            for t in tokens
+        )
+        # Separate digest domain from the raw-source keys
+        return blake2b(canonical.encode('utf-8'), digest_size=16,
+                       person=b'qlang-tokens').digest()
+    
+    def _cache_store(self, key: bytes, program: Program):
+        """Insert into the shared AST cache, evicting the oldest entry"""
+        cache = QLangParser._ast_cache
+        cache[key] = program
+        if len(cache) > self.AST_CACHE_SIZE:
+            cache.popitem(last=False)
+    
+    def _parse_tokens(self, tokens: List[Token], validator=None) -> Program:
+        """
+        Parse a comment-free token stream (no cache lookup), passing each
+        time step to validator._validate_time_step if a validator is given
+        """
+        NEWLINE = TokenType.NEWLINE
+        self.tokens = tokens
         self.pos = 0
         
         # Parse program
@@ -333,7 +583,7 @@ class QLangParser:
         
         while not self._is_eof():
             # Skip empty lines
-            if self._current_token().type == TokenType.NEWLINE:
+            if self._current_token().type == NEWLINE:
                 self._advance()
                 continue
             
@@ -346,18 +596,27 @@ class QLangParser:
                         num_qubits = op.count
                 
                 time_steps.append(time_step)
+                if validator is not None:
+                    validator._validate_time_step(time_step)
             
             # Expect newline or EOF
             if not self._is_eof():
-                self._expect(TokenType.NEWLINE)
+                self._expect(NEWLINE)
+        
+        # Don't keep the last token list alive between parses (the editor
+        # holds one parser for its whole lifetime)
+        self.tokens = []
+        self.pos = 0
         
         return Program(time_steps, num_qubits, 0, 0)
     
     def _parse_time_step(self) -> TimeStep:
         """Parse a single time step (one line)"""
+        SEMICOLON = TokenType.SEMICOLON
+        tokens = self.tokens
         operations = []
-        line = self._current_token().line
-        col = self._current_token().column
+        first = tokens[self.pos]
+        line, col = first.line, first.column
         
         while True:
             # Parse single operation
@@ -365,8 +624,8 @@ class QLangParser:
             operations.append(op)
             
             # Check for semicolon (parallel operation)
-            if self._current_token().type == TokenType.SEMICOLON:
-                self._advance()
+            if tokens[self.pos].type == SEMICOLON:
+                self.pos += 1
                 continue
             
             # End of time step
@@ -397,50 +656,46 @@ class QLangParser:
         gate_name = gate_token.value
         line, col = gate_token.line, gate_token.column
         
-        # Check for parameter (for Rx, Ry, Rz and modular gates)
-        parameter = None
-        mod_params = None  # For modular gates: (base, modulus)
+        kind = self._GATE_DISPATCH.get(gate_name)
         
-        if gate_name in self.PARAMETRIC_GATES:
+        if kind is None:
+            return self._parse_single_qubit_gate(gate_name, None, line, col)
+        if kind == 'two':
+            return self._parse_two_qubit_gate(gate_name, line, col)
+        if kind == 'parametric':
             param_token = self._expect(TokenType.PARAMETER)
             # Remove parentheses
             param_expr = param_token.value[1:-1]
             parameter = Parameter(param_expr, line, col)
-        elif gate_name in self.MODULAR_GATES:
-            # Parse modular gate parameters: MOD_EXP(base, modulus)
-            param_token = self._expect(TokenType.PARAMETER)
-            # Remove parentheses and split by comma
-            param_content = param_token.value[1:-1]
-            parts = [p.strip() for p in param_content.split(',')]
-            
-            if len(parts) != 2:
-                raise SyntaxError(
-                    f"Line {param_token.line}:{param_token.column}: "
-                    f"Modular gate requires 2 parameters (base, modulus), got {len(parts)}"
-                )
-            
-            try:
-                base = int(parts[0])
-                modulus = int(parts[1])
-                mod_params = (base, modulus)
-            except ValueError:
-                raise SyntaxError(
-                    f"Line {param_token.line}:{param_token.column}: "
-                    f"Modular gate parameters must be integers"
-                )
-        
-        # Determine gate type
-        if gate_name in self.QFT_GATES:
+            return self._parse_single_qubit_gate(gate_name, parameter, line, col)
+        if kind == 'three':
+            return self._parse_three_qubit_gate(gate_name, line, col)
+        if kind == 'qft':
             # QFT gates don't have parameters, go directly to parsing qubits
             return self._parse_qft_gate(gate_name, line, col)
-        elif gate_name in self.MODULAR_GATES:
-            return self._parse_modular_gate(gate_name, mod_params[0], mod_params[1], line, col)
-        elif gate_name in self.THREE_QUBIT_GATES:
-            return self._parse_three_qubit_gate(gate_name, line, col)
-        elif gate_name in self.TWO_QUBIT_GATES:
-            return self._parse_two_qubit_gate(gate_name, line, col)
-        else:
-            return self._parse_single_qubit_gate(gate_name, parameter, line, col)
+        
+        # Modular gate parameters: MOD_EXP(base, modulus)
+        param_token = self._expect(TokenType.PARAMETER)
+        # Remove parentheses and split by comma
+        param_content = param_token.value[1:-1]
+        parts = [p.strip() for p in param_content.split(',')]
+        
+        if len(parts) != 2:
+            raise SyntaxError(
+                f"Line {param_token.line}:{param_token.column}: "
+                f"Modular gate requires 2 parameters (base, modulus), got {len(parts)}"
+            )
+        
+        try:
+            base = int(parts[0])
+            modulus = int(parts[1])
+        except ValueError:
+            raise SyntaxError(
+                f"Line {param_token.line}:{param_token.column}: "
+                f"Modular gate parameters must be integers"
+            )
+        
+        return self._parse_modular_gate(gate_name, base, modulus, line, col)
     
     def _parse_measurement(self) -> MeasurementNode:
         """Parse measurement: measure qubit -> classical_bit"""
@@ -500,19 +755,21 @@ class QLangParser:
     
     def _parse_condition(self) -> Condition:
         """Parse condition expression"""
+        AND, OR = TokenType.AND, TokenType.OR
         # Parse primary condition
         left = self._parse_primary_condition()
         
         # Check for logical operators
+        tokens = self.tokens
         while True:
-            current = self._current_token()
+            current = tokens[self.pos]
             
-            if current.type == TokenType.AND:
-                self._advance()
+            if current.type == AND:
+                self.pos += 1
                 right = self._parse_primary_condition()
                 left = AndCondition(left, right, current.line, current.column)
-            elif current.type == TokenType.OR:
-                self._advance()
+            elif current.type == OR:
+                self.pos += 1
                 right = self._parse_primary_condition()
                 left = OrCondition(left, right, current.line, current.column)
             else:
@@ -556,97 +813,106 @@ class QLangParser:
     def _parse_single_qubit_gate(self, gate_name: str, parameter: Optional[Parameter],
                                    line: int, col: int) -> SingleQubitGate:
         """Parse single-qubit gate with qubit list"""
-        qubits = []
-        
-        # Parse first qubit
-        qubit_token = self._expect(TokenType.NUMBER)
-        qubits.append(int(qubit_token.value))
-        
-        # Parse additional qubits (comma-separated)
-        while self._current_token().type == TokenType.COMMA:
-            self._advance()
-            qubit_token = self._expect(TokenType.NUMBER)
-            qubits.append(int(qubit_token.value))
-        
+        NUMBER, COMMA = TokenType.NUMBER, TokenType.COMMA
+        tokens = self.tokens
+        pos = self.pos
+        
+        # Scan the comma-separated run "N, N, ..., N" first so the qubit
+        # list is built in one allocation instead of grown by appends
+        end = pos
+        while tokens[end].type == NUMBER and tokens[end + 1].type == COMMA:
+            end += 2
+        if tokens[end].type != NUMBER:
+            self.pos = end
+            self._expect(NUMBER)  # raises SyntaxError
+        qubits = [int(token.value) for token in tokens[pos:end + 1:2]]
+        
+        self.pos = end + 1
         return SingleQubitGate(gate_name, qubits, parameter, line, col)
     
     def _parse_two_qubit_gate(self, gate_name: str, line: int, col: int) -> TwoQubitGate:
         """Parse two-qubit gate (control-target)"""
-        control_token = self._expect(TokenType.NUMBER)
-        control = int(control_token.value)
-        
-        self._expect(TokenType.DASH)
-        
-        target_token = self._expect(TokenType.NUMBER)
-        target = int(target_token.value)
-        
+        control, target = self._parse_dashed_qubits(_TWO_QUBIT_SHAPE)
         return TwoQubitGate(gate_name, control, target, line, col)
     
     def _parse_three_qubit_gate(self, gate_name: str, line: int, col: int) -> ThreeQubitGate:
         """Parse three-qubit gate (control1-control2-target)"""
-        control1_token = self._expect(TokenType.NUMBER)
-        control1 = int(control1_token.value)
-        
-        self._expect(TokenType.DASH)
-        
-        control2_token = self._expect(TokenType.NUMBER)
-        control2 = int(control2_token.value)
+        control1, control2, target = self._parse_dashed_qubits(_THREE_QUBIT_SHAPE)
+        return ThreeQubitGate(gate_name, control1, control2, target, line, col)
+    
+    def _parse_dashed_qubits(self, shape: tuple) -> List[int]:
+        """
+        Parse a fixed-shape operand run such as N-N or N-N-N.
         
-        self._expect(TokenType.DASH)
+        The whole shape is checked by indexing the token list directly; on
+        a mismatch _expect() raises the usual SyntaxError at that token.
+        """
+        tokens = self.tokens
+        pos = self.pos
         
-        target_token = self._expect(TokenType.NUMBER)
-        target = int(target_token.value)
+        for offset, expected in enumerate(shape):
+            if tokens[pos + offset].type != expected:
+                self.pos = pos + offset
+                self._expect(expected)  # raises SyntaxError
         
-        return ThreeQubitGate(gate_name, control1, control2, target, line, col)
+        end = pos + len(shape)
+        self.pos = end
+        return [int(token.value) for token in tokens[pos:end:2]]
     
     def _parse_modular_gate(self, gate_name: str, base: int, modulus: int,
                            line: int, col: int) -> ModularGate:
         """Parse modular arithmetic gate: MOD_EXP(7,15) 0,1,2-4,5,6,7"""
+        NUMBER, COMMA, ARROW, DASH = TokenType.NUMBER, TokenType.COMMA, TokenType.ARROW, TokenType.DASH
         # Parse control qubits (comma-separated list)
         control_qubits = []
-        control_token = self._expect(TokenType.NUMBER)
+        control_token = self._expect(NUMBER)
         control_qubits.append(int(control_token.value))
         
-        while self._current_token().type == TokenType.COMMA:
+        while self._current_token().type == COMMA:
             self._advance()
-            control_token = self._expect(TokenType.NUMBER)
+            control_token = self._expect(NUMBER)
             control_qubits.append(int(control_token.value))
         
         # Expect dash or arrow separator
-        if self._current_token().type == TokenType.ARROW:
+        if self._current_token().type == ARROW:
             self._advance()
         else:
-            self._expect(TokenType.DASH)
+            self._expect(DASH)
         
         # Parse target qubits (comma-separated list)
         target_qubits = []
-        target_token = self._expect(TokenType.NUMBER)
+        target_token = self._expect(NUMBER)
         target_qubits.append(int(target_token.value))
         
-        while self._current_token().type == TokenType.COMMA:
+        while self._current_token().type == COMMA:
             self._advance()
-            target_token = self._expect(TokenType.NUMBER)
+            target_token = self._expect(NUMBER)
             target_qubits.append(int(target_token.value))
         
         return ModularGate(gate_name, base, modulus, control_qubits, target_qubits, line, col)
     
     def _parse_qft_gate(self, gate_name: str, line: int, col: int) -> QFTNode:
         """Parse QFT gate: QFT 0,1,2,3 or QFT_INV 0,1,2,3"""
+        NUMBER, COMMA = TokenType.NUMBER, TokenType.COMMA
         is_inverse = (gate_name == 'QFT_INV')
         
         # Parse qubit list (comma-separated)
         qubits = []
-        qubit_token = self._expect(TokenType.NUMBER)
+        qubit_token = self._expect(NUMBER)
         qubits.append(int(qubit_token.value))
         
-        while self._current_token().type == TokenType.COMMA:
+        while self._current_token().type == COMMA:
             self._advance()
-            qubit_token = self._expect(TokenType.NUMBER)
+            qubit_token = self._expect(NUMBER)
             qubits.append(int(qubit_token.value))
         
         return QFTNode(is_inverse, qubits, line, col)
     
     # Helper methods
+    #
+    # The token list always ends with EOF and self.pos never moves past it,
+    # so hot paths index self.tokens[self.pos] directly and step over any
+    # non-EOF token with a plain increment.
     def _current_token(self) -> Token:
         """Get current token"""
         if self.pos < len(self.tokens):
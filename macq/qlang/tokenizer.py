@@ -3,10 +3,14 @@ Q-Lang Tokenizer
 Lexical analysis for quantum circuit description language
 """
 
+import gc
 import re
+import sys
 from enum import Enum, auto
-from dataclasses import dataclass
-from typing import List, Optional
+from functools import lru_cache
+from itertools import groupby, repeat
+from operator import itemgetter
+from typing import List, NamedTuple, Optional
 
 
 class TokenType(Enum):
@@ -44,9 +48,8 @@ class TokenType(Enum):
     INVALID = auto()
 
 
-@dataclass
-class Token:
-    """Represents a single token"""
+class Token(NamedTuple):
+    """Represents a single token (tuple-backed: cheap to build, C-level field access)"""
     type: TokenType
     value: str
     line: int
@@ -56,12 +59,44 @@ class Token:
         return f"Token({self.type.name}, '{self.value}', L{self.line}:C{self.column})"
 
 
+# Character classes for the vectorized tokenizer (see _tokenize_large)
+_CAT_OTHER, _CAT_WORD, _CAT_SPACE, _CAT_NEWLINE, _CAT_PUNCT, _CAT_SPAN = range(6)
+
+# Non-ASCII characters the vectorized tokenizer understands; any other one
+# sends the source through the regex tokenizer (\d and \b are Unicode-aware)
+_WIDE_CHARS = frozenset(map(ord, 'π†'))
+
+
+@lru_cache(maxsize=None)
+def _category_table():
+    """Code point (clipped to 128) -> character class lookup table"""
+    import numpy as np
+    table = np.full(129, _CAT_OTHER, dtype=np.uint8)
+    for char in 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_':
+        table[ord(char)] = _CAT_WORD
+    for char in ' \t':
+        table[ord(char)] = _CAT_SPACE
+    table[ord('\n')] = _CAT_NEWLINE
+    for char in ';,-()':
+        table[ord(char)] = _CAT_PUNCT
+    return table
+
+
 class QLangTokenizer:
     """Tokenizer for Q-Lang"""
     
-    # Token patterns (order matters for matching)
+    # Token patterns, tried in order. Most patterns start with characters no
+    # other pattern accepts, so the list is sorted by how often each token
+    # occurs in real programs (each failed alternative costs the regex
+    # engine a branch); only the commented pairs depend on their order.
     TOKEN_PATTERNS = [
-        (TokenType.COMMENT, r'#[^\n]*'),
+        (TokenType.NUMBER, r'\d+'),
+        (TokenType.GATE_NAME, r'[A-Z][A-Za-z0-9_†]*'),  # Allow underscores for MOD_EXP
+        (TokenType.ARROW, r'->'),  # Must be before DASH
+        (TokenType.DASH, r'-'),
+        (TokenType.SEMICOLON, r';'),
+        (TokenType.COMMA, r','),
+        (TokenType.NEWLINE, r'\n'),
         # Keywords - must be before identifiers
         (TokenType.MEASURE, r'\bmeasure\b'),
         (TokenType.IF, r'\bif\b'),
@@ -70,34 +105,49 @@ class QLangTokenizer:
         (TokenType.OR, r'\bor\b'),
         (TokenType.NOT, r'\bnot\b'),
         (TokenType.QUBITS, r'\bqubits\b'),
-        (TokenType.GATE_NAME, r'[A-Z][A-Za-z0-9_†]*'),  # Allow underscores for MOD_EXP
         (TokenType.IDENTIFIER, r'[a-z][a-z0-9_]*'),  # Lowercase identifiers for classical bits
-        (TokenType.NUMBER, r'\d+'),
-        (TokenType.PARAMETER, r'\([^)]+\)'),
-        (TokenType.EQUALS, r'=='),  # Must be before other operators
-        (TokenType.ARROW, r'->'),  # Must be before DASH
-        (TokenType.SEMICOLON, r';'),
-        (TokenType.COMMA, r','),
-        (TokenType.DASH, r'-'),
+        (TokenType.PARAMETER, r'\([^)]+\)'),  # Must be before LPAREN
         (TokenType.LPAREN, r'\('),
         (TokenType.RPAREN, r'\)'),
-        (TokenType.NEWLINE, r'\n'),
+        (TokenType.EQUALS, r'=='),
+        (TokenType.COMMENT, r'#[^\n]*'),
     ]
     
-    # Valid gate names
-    ALLOWED_GATES = {
+    # Valid gate names (interned, like the gate names emitted by tokenize)
+    ALLOWED_GATES = frozenset(map(sys.intern, {
         'H', 'X', 'Y', 'Z', 'S', 'T', 'S†', 'T†',  # Single qubit
         'Rx', 'Ry', 'Rz',  # Parametric
         'CNOT', 'CX', 'CZ', 'SWAP',  # Two qubit
         'Toffoli', 'CCNOT', 'CCZ',  # Three qubit
         'MOD_EXP', 'MOD_ADD', 'MOD_MUL',  # Modular arithmetic (v2.0)
         'QFT', 'QFT_INV',  # Quantum Fourier Transform (v2.0)
-    }
+    }))
+    
+    # Combined regex, compiled once when the class is defined (shared by all
+    # instances instead of rebuilt per tokenizer). The leading SKIP group
+    # consumes spaces/tabs inside the regex engine; it is not a TokenType.
+    pattern = r'(?P<SKIP>[ \t]+)|' + '|'.join(f'(?P<{t.name}>{p})' for t, p in TOKEN_PATTERNS)
+    regex = re.compile(pattern)
+    
+    # Regex group name -> TokenType
+    _TYPE_BY_GROUP = {t.name: t for t, _ in TOKEN_PATTERNS}
     
-    def __init__(self):
-        # Compile regex patterns
-        self.pattern = '|'.join(f'(?P<{t.name}>{p})' for t, p in self.TOKEN_PATTERNS)
-        self.regex = re.compile(self.pattern)
+    # Sources longer than this are tokenized by _tokenize_large
+    VECTORIZE_THRESHOLD = 64_000
+    
+    # Multi-character tokens that can swallow other characters, in source order
+    _SPAN_REGEX = re.compile(r'#[^\n]*|\([^)]+\)|->|==')
+    
+    # Token text -> TokenType for tokens fully determined by their text
+    _TYPE_BY_VALUE = {
+        'measure': TokenType.MEASURE, 'if': TokenType.IF, 'then': TokenType.THEN,
+        'and': TokenType.AND, 'or': TokenType.OR, 'not': TokenType.NOT,
+        'qubits': TokenType.QUBITS,
+        ';': TokenType.SEMICOLON, ',': TokenType.COMMA, '-': TokenType.DASH,
+        '(': TokenType.LPAREN, ')': TokenType.RPAREN, '->': TokenType.ARROW,
+        '==': TokenType.EQUALS, '\n': TokenType.NEWLINE,
+        **{gate: TokenType.GATE_NAME for gate in ALLOWED_GATES},
+    }
     
     def tokenize(self, code: str) -> List[Token]:
         """
@@ -112,75 +162,214 @@ class QLangTokenizer:
         Raises:
             SyntaxError: If invalid token encountered
         """
+        if len(code) > self.VECTORIZE_THRESHOLD:
+            tokens = self._tokenize_large(code)
+            if tokens is not None:
+                return tokens
+        
+        GATE_NAME, IDENTIFIER, NEWLINE = TokenType.GATE_NAME, TokenType.IDENTIFIER, TokenType.NEWLINE
+        type_by_group = self._TYPE_BY_GROUP
+        # Build Token tuples directly, skipping NamedTuple's Python-level __new__
+        new_token = tuple.__new__
+        allowed_gates = self.ALLOWED_GATES
+        
         tokens = []
         line = 1
         line_start = 0
+        expected = 0  # end of the previous match
         
         for match in self.regex.finditer(code):
-            token_type = TokenType[match.lastgroup]
-            value = match.group()
-            column = match.start() - line_start + 1
+            start = match.start()
+            
+            # Whitespace is matched by SKIP, so any gap is an invalid character
+            if start != expected:
+                raise SyntaxError(
+                    f"Line {line}: Invalid character '{code[expected]}'"
+                )
+            expected = match.end()
             
-            # Skip whitespace (spaces, tabs)
-            if value.isspace() and token_type != TokenType.NEWLINE:
+            group = match.lastgroup
+            if group == 'SKIP':
                 continue
             
+            token_type = type_by_group[group]
+            value = match.group()
+            column = start - line_start + 1
+            
             # Validate gate names
-            if token_type == TokenType.GATE_NAME:
-                if value not in self.ALLOWED_GATES:
+            if token_type == GATE_NAME:
+                # Intern so later set/dict lookups on the name hit the
+                # identity fast path
+                value = sys.intern(value)
+                if value not in allowed_gates:
                     raise SyntaxError(
                         f"Line {line}:{column}: Unknown gate '{value}'"
                     )
+            elif token_type == IDENTIFIER:
+                # Classical bit names (c0, c1, ...) repeat across measure/if
+                # lines; share one string object per name
+                value = sys.intern(value)
             
             # Create token
-            token = Token(token_type, value, line, column)
-            tokens.append(token)
+            tokens.append(new_token(Token, (token_type, value, line, column)))
             
             # Track line numbers
-            if token_type == TokenType.NEWLINE:
+            if token_type == NEWLINE:
                 line += 1
-                line_start = match.end()
-        
-        # Check for unmatched characters
-        total_matched = sum(len(t.value) for t in tokens if t.type != TokenType.NEWLINE)
-        code_no_whitespace = re.sub(r'[ \t]+', '', code)
-        code_no_newlines = code_no_whitespace.replace('\n', '')
-        
-        if total_matched < len(code_no_newlines):
-            # Find first unmatched character
-            pos = 0
-            for token in tokens:
-                pos += len(token.value)
-            
-            if pos < len(code):
-                line_num = code[:pos].count('\n') + 1
-                raise SyntaxError(
-                    f"Line {line_num}: Invalid character '{code[pos]}'"
-                )
+                line_start = expected
+        
+        # Check for unmatched characters after the last token
+        if expected < len(code):
+            raise SyntaxError(
+                f"Line {line}: Invalid character '{code[expected]}'"
+            )
         
         # Add EOF token
         tokens.append(Token(TokenType.EOF, '', line, 0))
         
         return tokens
     
+    def _tokenize_large(self, code: str) -> Optional[List[Token]]:
+        """
+        Vectorized tokenize() for very large sources (same tokens and errors)
+        
+        Every character is classified through a lookup table in NumPy, token
+        boundaries are where the class changes, and lines/columns come from
+        cumulative sums, so the per-token work left in Python is C-level
+        map/zip calls. Comments, parameters, '->' and '==' are located first
+        with one regex scan since they may contain characters of any class.
+        Runs whose type is not obvious from their text (e.g. 'cX', unknown
+        gates, invalid characters) are re-tokenized with the regex.
+        
+        Returns None if the source contains characters this path does not
+        handle; the caller then uses the regex tokenizer.
+        """
+        import numpy as np
+        
+        points = np.frombuffer(code.encode('utf-32-le'), dtype=np.uint32)
+        wide = points >= 128
+        if wide.any() and not _WIDE_CHARS.issuperset(np.unique(points[wide]).tolist()):
+            return None
+        
+        # Classify characters; comments/parameters/->/== become single spans
+        cats = _category_table()[np.minimum(points, 128)]
+        cats[points == ord('†')] = _CAT_WORD  # S†, T†
+        span_starts = []
+        for match in self._SPAN_REGEX.finditer(code):
+            start, end = match.span()
+            cats[start:end] = _CAT_SPAN
+            span_starts.append(start)
+        
+        # A token starts wherever the class changes, at every newline,
+        # punctuation or invalid character, and at every span
+        boundary = np.empty(len(cats), dtype=bool)
+        boundary[0] = True
+        np.not_equal(cats[1:], cats[:-1], out=boundary[1:])
+        boundary |= (cats == _CAT_NEWLINE) | (cats == _CAT_PUNCT) | (cats == _CAT_OTHER)
+        boundary[span_starts] = True
+        starts = np.flatnonzero(boundary)
+        ends = np.append(starts[1:], len(cats))
+        run_cats = cats[starts]
+        keep = run_cats != _CAT_SPACE
+        starts, ends, run_cats = starts[keep], ends[keep], run_cats[keep]
+        
+        # Line = 1 + newline tokens before; column counts from the last one
+        is_newline = run_cats == _CAT_NEWLINE
+        lines = np.cumsum(is_newline) - is_newline + 1
+        line_starts = np.maximum.accumulate(np.where(is_newline, ends, 0))
+        columns = starts - np.concatenate(([0], line_starts[:-1])) + 1
+        
+        # Types not given by the token text: numbers, lowercase identifiers,
+        # comments and parameters (0 = decide with the regex)
+        is_digit = (points >= ord('0')) & (points <= ord('9'))
+        is_lower = (points >= ord('a')) & (points <= ord('z'))
+        digit_count = np.concatenate(([0], np.cumsum(is_digit)))
+        ident_count = np.concatenate(([0], np.cumsum(is_lower | is_digit | (points == ord('_')))))
+        lengths = ends - starts
+        first = points[starts]
+        kinds = np.zeros(len(starts), dtype=np.uint8)
+        kinds[digit_count[ends] - digit_count[starts] == lengths] = 1
+        kinds[is_lower[starts] & (ident_count[ends] - ident_count[starts] == lengths)] = 2
+        kinds[(run_cats == _CAT_SPAN) & (first == ord('#'))] = 3
+        kinds[(run_cats == _CAT_SPAN) & (first == ord('('))] = 4
+        default_types = (None, TokenType.NUMBER, TokenType.IDENTIFIER,
+                         TokenType.COMMENT, TokenType.PARAMETER)
+        
+        starts, ends = starts.tolist(), ends.tolist()
+        lines, columns = lines.tolist(), columns.tolist()
+        # Token tuples cannot form reference cycles; pausing the cyclic GC
+        # avoids repeated collections while they are allocated in bulk
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            values = list(map(sys.intern, map(code.__getitem__, map(slice, starts, ends))))
+            types = list(map(self._TYPE_BY_VALUE.get, values,
+                             map(default_types.__getitem__, kinds.tolist())))
+            tokens = list(map(tuple.__new__, repeat(Token), zip(types, values, lines, columns)))
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        
+        # Re-tokenize the leftover runs in source order (raising the first
+        # error), then splice the results in from the back
+        if None in types:
+            replacements = []
+            index = types.index(None)
+            while True:
+                replacements.append(
+                    (index, self._retokenize_run(code, starts[index], ends[index],
+                                                 lines[index], columns[index]))
+                )
+                try:
+                    index = types.index(None, index + 1)
+                except ValueError:
+                    break
+            for index, run_tokens in reversed(replacements):
+                tokens[index:index + 1] = run_tokens
+        
+        tokens.append(Token(TokenType.EOF, '', int(is_newline.sum()) + 1, 0))
+        return tokens
+    
+    def _retokenize_run(self, code: str, start: int, end: int,
+                        line: int, column: int) -> List[Token]:
+        """Regex-tokenize code[start:end], which lies on a single line"""
+        line_start = start - column + 1
+        tokens = []
+        while start < end:
+            match = self.regex.match(code, start)
+            if match is None:
+                raise SyntaxError(
+                    f"Line {line}: Invalid character '{code[start]}'"
+                )
+            token_type = self._TYPE_BY_GROUP[match.lastgroup]
+            value = sys.intern(match.group())
+            column = start - line_start + 1
+            if token_type == TokenType.GATE_NAME and value not in self.ALLOWED_GATES:
+                raise SyntaxError(
+                    f"Line {line}:{column}: Unknown gate '{value}'"
+                )
+            tokens.append(Token(token_type, value, line, column))
+            start = match.end()
+        return tokens
+    
     def filter_comments(self, tokens: List[Token]) -> List[Token]:
         """Remove comment tokens"""
         return [t for t in tokens if t.type != TokenType.COMMENT]
     
     def filter_newlines(self, tokens: List[Token]) -> List[Token]:
         """Remove unnecessary newlines (keep only significant ones)"""
+        NEWLINE = TokenType.NEWLINE
         result = []
-        prev_was_newline = False
-        
-        for token in tokens:
-            if token.type == TokenType.NEWLINE:
-                # Only keep if not preceded by another newline
-                if not prev_was_newline and result:
-                    result.append(token)
-                prev_was_newline = True
+        
+        # Runs of same-typed tokens; Token is a tuple, so type is item 0
+        for token_type, run in groupby(tokens, key=itemgetter(0)):
+            if token_type is NEWLINE:
+                # Keep only the first of consecutive newlines, and none
+                # before the first real token
+                if result:
+                    result.append(next(run))
             else:
-                result.append(token)
-                prev_was_newline = False
+                result.extend(run)
         
         return result
 
@@ -7,7 +7,8 @@ from typing import List, Set, Optional
 from .parser import (
     Program, TimeStep, GateOperation,
     SingleQubitGate, TwoQubitGate, ThreeQubitGate,
-    MeasurementNode, ConditionalNode, ModularGate, QFTNode, QubitsNode
+    MeasurementNode, ConditionalNode, ModularGate, QFTNode, QubitsNode,
+    PARAMETRIC_GATES
 )
 
 
@@ -16,6 +17,11 @@ class ValidationError(Exception):
     pass
 
 
+def _mask_to_qubits(mask: int) -> Set[int]:
+    """Set of qubit indices whose bits are set in mask"""
+    return {qubit for qubit in range(mask.bit_length()) if mask >> qubit & 1}
+
+
 class QLangValidator:
     """Validator for Q-Lang programs"""
     
@@ -28,6 +34,20 @@ class QLangValidator:
         """
         self.num_qubits = num_qubits
         self.errors = []
+        # Last program that passed validation, with the qubit count used.
+        # Parsed programs are shared read-only objects (see
+        # QLangParser.parse), so re-validating the same one can be skipped.
+        self._last_valid = None
+    
+    def reset(self, num_qubits: int):
+        """
+        Reuse this validator for a (possibly different) qubit count
+        
+        Args:
+            num_qubits: Total number of available qubits
+        """
+        self.num_qubits = num_qubits
+        self.errors = []
     
     def validate(self, program: Program) -> bool:
         """
@@ -41,11 +61,17 @@ class QLangValidator:
         """
         self.errors = []
         
+        last_valid = self._last_valid
+        if (last_valid is not None and last_valid[0] is program
+                and last_valid[1] == self.num_qubits):
+            return True
+        
         try:
             self._validate_program(program)
         except ValidationError as e:
             raise
         
+        self._last_valid = (program, self.num_qubits)
         return len(self.errors) == 0
     
     def _validate_program(self, program: Program):
@@ -60,65 +86,62 @@ class QLangValidator:
         Checks:
         1. Each operation is valid
         2. No qubit is used twice in same time step
+        
+        Qubit sets are tracked as int bitmasks (bit q = qubit q), memoized
+        on each operation node; indices are already range-checked by
+        _validate_operation.
         """
-        used_qubits: Set[int] = set()
+        used_mask = 0
         
         for operation in time_step.operations:
             # Validate individual operation
             self._validate_operation(operation)
             
             # Get all qubits involved in this operation
-            involved_qubits = self._get_involved_qubits(operation)
+            involved_mask = operation.qubit_mask()
             
             # Check for conflicts
-            conflicts = used_qubits & involved_qubits
-            if conflicts:
+            conflict_mask = used_mask & involved_mask
+            if conflict_mask:
+                conflicts = _mask_to_qubits(conflict_mask)
                 raise ValidationError(
                     f"Line {operation.line}: Qubit(s) {conflicts} used multiple times "
                     f"in same time step"
                 )
             
-            used_qubits.update(involved_qubits)
+            used_mask |= involved_mask
     
     def _validate_operation(self, operation: GateOperation):
         """Validate a single gate operation"""
-        
-        if isinstance(operation, SingleQubitGate):
-            self._validate_single_qubit_gate(operation)
-        elif isinstance(operation, TwoQubitGate):
-            self._validate_two_qubit_gate(operation)
-        elif isinstance(operation, ThreeQubitGate):
-            self._validate_three_qubit_gate(operation)
-        elif isinstance(operation, ModularGate):
-            self._validate_modular_gate(operation)
-        elif isinstance(operation, MeasurementNode):
-            self._validate_measurement(operation)
-        elif isinstance(operation, ConditionalNode):
-            self._validate_conditional(operation)
-        elif isinstance(operation, QFTNode):
-            self._validate_qft(operation)
-        elif isinstance(operation, QubitsNode):
-            pass
+        # One dict probe on the node class instead of an isinstance cascade
+        validate_fn = self._VALIDATE_DISPATCH.get(operation.__class__)
+        if validate_fn is not None:
+            # QubitsNode (and unknown nodes) need no checks
+            validate_fn(self, operation)
     
     def _validate_single_qubit_gate(self, gate: SingleQubitGate):
         """Validate single-qubit gate"""
-        # Check qubit indices
+        # Check qubit indices and collect duplicate qubits in one pass
+        num_qubits = self.num_qubits
+        seen = set()
+        duplicates = set()
         for qubit in gate.qubits:
-            if qubit < 0 or qubit >= self.num_qubits:
+            if qubit < 0 or qubit >= num_qubits:
                 raise ValidationError(
-                    f"Line {gate.line}: Qubit {qubit} out of range [0, {self.num_qubits-1}]"
+                    f"Line {gate.line}: Qubit {qubit} out of range [0, {num_qubits-1}]"
                 )
+            if qubit in seen:
+                duplicates.add(qubit)
+            else:
+                seen.add(qubit)
         
-        # Check for duplicate qubits in list
-        if len(gate.qubits) != len(set(gate.qubits)):
-            duplicates = [q for q in gate.qubits if gate.qubits.count(q) > 1]
+        if duplicates:
             raise ValidationError(
-                f"Line {gate.line}: Duplicate qubit(s) {set(duplicates)} in gate operation"
+                f"Line {gate.line}: Duplicate qubit(s) {duplicates} in gate operation"
             )
         
         # Check parameter requirements
-        parametric_gates = {'Rx', 'Ry', 'Rz'}
-        if gate.gate_name in parametric_gates:
+        if gate.gate_name in PARAMETRIC_GATES:
             if gate.parameter is None:
                 raise ValidationError(
                     f"Line {gate.line}: Gate '{gate.gate_name}' requires a parameter"
@@ -207,37 +230,39 @@ class QLangValidator:
     
     def _validate_qft(self, node: QFTNode):
         """Validate QFT operation"""
-        # Check all qubits in range
+        # Check all qubits in range and collect duplicates in one pass
+        num_qubits = self.num_qubits
+        seen = set()
+        duplicates = set()
         for qubit in node.qubits:
-            if qubit < 0 or qubit >= self.num_qubits:
+            if qubit < 0 or qubit >= num_qubits:
                 raise ValidationError(
-                    f"Line {node.line}: Qubit {qubit} out of range [0, {self.num_qubits-1}]"
+                    f"Line {node.line}: Qubit {qubit} out of range [0, {num_qubits-1}]"
                 )
+            if qubit in seen:
+                duplicates.add(qubit)
+            else:
+                seen.add(qubit)
         
-        # Check for duplicate qubits
-        if len(node.qubits) != len(set(node.qubits)):
-            duplicates = [q for q in node.qubits if node.qubits.count(q) > 1]
+        if duplicates:
             raise ValidationError(
-                f"Line {node.line}: Duplicate qubit(s) {set(duplicates)} in QFT operation"
+                f"Line {node.line}: Duplicate qubit(s) {duplicates} in QFT operation"
             )
     
     def _get_involved_qubits(self, operation: GateOperation) -> Set[int]:
         """Get all qubits involved in an operation"""
-        if isinstance(operation, SingleQubitGate):
-            return set(operation.qubits)
-        elif isinstance(operation, TwoQubitGate):
-            return {operation.control, operation.target}
-        elif isinstance(operation, ThreeQubitGate):
-            return {operation.control1, operation.control2, operation.target}
-        elif isinstance(operation, ModularGate):
-            return set(operation.control_qubits) | set(operation.target_qubits)
-        elif isinstance(operation, MeasurementNode):
-            return {operation.qubit}
-        elif isinstance(operation, ConditionalNode):
-            return self._get_involved_qubits(operation.operation)
-        elif isinstance(operation, QFTNode):
-            return set(operation.qubits)
-        return set()
+        return _mask_to_qubits(operation.qubit_mask())
+    
+    # AST node class -> validate method
+    _VALIDATE_DISPATCH = {
+        SingleQubitGate: _validate_single_qubit_gate,
+        TwoQubitGate: _validate_two_qubit_gate,
+        ThreeQubitGate: _validate_three_qubit_gate,
+        ModularGate: _validate_modular_gate,
+        MeasurementNode: _validate_measurement,
+        ConditionalNode: _validate_conditional,
+        QFTNode: _validate_qft,
+    }
 
 
 # ============================================================================
@@ -245,102 +270,37 @@ class QLangValidator:
 # ============================================================================
 
 if __name__ == '__main__':
+    import time
     from .parser import QLangParser
     
     parser = QLangParser()
+    validator = QLangValidator(num_qubits=1)
     
-    # Test 1: Valid Bell state
-    print("Test 1: Valid Bell state")
-    print("=" * 60)
-    code1 ="""
-H 0
-CNOT 0-1
-    """
-    ast1 = parser.parse(code1)
-    validator1 = QLangValidator(num_qubits=2)
-    try:
-        validator1.validate(ast1)
-        print("✅ Validation passed!")
-    except ValidationError as e:
-        print(f"❌ Validation failed: {e}")
-    print()
-    
-    # Test 2: Error - Qubit out of range
-    print("Test 2: Error - Qubit out of range")
-    print("=" * 60)
-    code2 = "H 5"
-    ast2 = parser.parse(code2)
-    validator2 = QLangValidator(num_qubits=3)
-    try:
-        validator2.validate(ast2)
-        print("✅ Validation passed!")
-    except ValidationError as e:
-        print(f"❌ Validation failed: {e}")
-    print()
+    # (label, code, num_qubits)
+    TESTS = [
+        ("Valid Bell state", "H 0\nCNOT 0-1\n", 2),
+        ("Error - Qubit out of range", "H 5", 3),
+        ("Error - Same qubit used twice", "H 0; X 0", 3),
+        ("Error - Control = Target", "CNOT 0-0", 3),
+        ("Valid parallel operations", "H 0, 2; X 1; CNOT 3-4", 5),
+        ("Error - Missing parameter for Rx", "Rx 0", 1),  # Fails parsing already
+        ("Complex valid circuit", "H 0, 2, 4; X 1, 3\nCNOT 0-1; CNOT 2-3\nToffoli 0-1-2\n", 5),
+    ]
     
-    # Test 3: Error - Same qubit used twice in time step
-    print("Test 3: Error - Same qubit used twice")
-    print("=" * 60)
-    code3 = "H 0; X 0"
-    ast3 = parser.parse(code3)
-    validator3 = QLangValidator(num_qubits=3)
-    try:
-        validator3.validate(ast3)
-        print("✅ Validation passed!")
-    except ValidationError as e:
-        print(f"❌ Validation failed: {e}")
-    print()
-    
-    # Test 4: Error - Control = Target
-    print("Test 4: Error - Control = Target")
-    print("=" * 60)
-    code4 = "CNOT 0-0"
-    ast4 = parser.parse(code4)
-    validator4 = QLangValidator(num_qubits=3)
-    try:
-        validator4.validate(ast4)
-        print("✅ Validation passed!")
-    except ValidationError as e:
-        print(f"❌ Validation failed: {e}")
-    print()
-    
-    # Test 5: Valid parallel operations
-    print("Test 5: Valid parallel operations")
-    print("=" * 60)
-    code5 = "H 0, 2; X 1; CNOT 3-4"
-    ast5 = parser.parse(code5)
-    validator5 = QLangValidator(num_qubits=5)
-    try:
-        validator5.validate(ast5)
-        print("✅ Validation passed!")
-    except ValidationError as e:
-        print(f"❌ Validation failed: {e}")
-    print()
-    
-    # Test 6: Error - Missing parameter
-    print("Test 6: Error - Missing parameter for Rx")
-    print("=" * 60)
-    try:
-        code6 = "Rx 0"  # Should fail parsing already
-        ast6 = parser.parse(code6)
-    except Exception as e:
-        print(f"❌ Parse error (expected): {e}")
-    print()
-    
-    # Test 7: Complex valid circuit
-    print("Test 7: Complex valid circuit")
-    print("=" * 60)
-    code7 = """
-H 0, 2, 4; X 1, 3
-CNOT 0-1; CNOT 2-3
-Toffoli 0-1-2
-    """
-    ast7 = parser.parse(code7)
-    validator7 = QLangValidator(num_qubits=5)
-    try:
-        validator7.validate(ast7)
-        print("✅ Validation passed!")
-    except ValidationError as e:
-        print(f"❌ Validation failed: {e}")
+    start = time.perf_counter_ns()
+    results = []
+    for number, (label, code, num_qubits) in enumerate(TESTS, 1):
+        try:
+            ast = parser.parse(code)
+            validator.reset(num_qubits)
+            validator.validate(ast)
+            outcome = "✅ Validation passed!"
+        except ValidationError as e:
+            outcome = f"❌ Validation failed: {e}"
+        except Exception as e:
+            outcome = f"❌ Parse error (expected): {e}"
+        results.append(f"Test {number}: {label}\n  {outcome}")
+    elapsed_us = (time.perf_counter_ns() - start) / 1000
     
-    print("\n✅ All validator tests completed!")
+    print("\n".join(results))
+    print(f"\n✅ All {len(TESTS)} validator tests completed in {elapsed_us:.0f} µs!")
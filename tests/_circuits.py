@@ -0,0 +1,26 @@
+"""
+Shared Q-Lang circuit templates for the test scripts
+"""
+
+import functools
+
+
+@functools.lru_cache(maxsize=32)
+def shor_template(N, a, n_in, n_out):
+    """
+    Shor period-finding circuit for factoring N with base a.
+
+    Input register is qubits 0..n_in-1, output register the next n_out
+    qubits. Identical arguments return the identical string, so repeated
+    parses also hit the parser's source cache.
+    """
+    inputs = list(map(str, range(n_in)))
+    outputs = list(map(str, range(n_in, n_in + n_out)))
+    lines = [
+        f"# Shor's algorithm: factor N={N} using a={a}",
+        f"H {', '.join(inputs)}",
+        f"MOD_EXP({a}, {N}) {','.join(inputs)}-{','.join(outputs)}",
+        f"QFT_INV {', '.join(inputs)}",
+    ]
+    lines.extend(f"measure {q} -> c{q}" for q in inputs)
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the Python bridge (C engine via ctypes)
+
+Same operations as test_python_bridge.py, but timed and without any
+correctness checks, so the numbers are not skewed by assertion work.
+Run with:  python -O tests/bench_python_bridge.py [--qubits 10 20]
+"""
+
+import argparse
+import os
+import sys
+from time import perf_counter_ns
+
+# Add parent directory to path (when run as a script)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from macq import QuantumState, version
+
+SEP = "=" * 60
+
+
+def bench_single_gate(qs):
+    qs.h(0)
+
+
+def bench_cnot(qs):
+    qs.cnot(0, qs.num_qubits - 1)
+
+
+def bench_rotation(qs):
+    qs.rx(0, 0.5)
+
+
+def bench_h_loop(qs):
+    for q in range(qs.num_qubits):
+        qs.h(q)
+
+
+def bench_h_all(qs):
+    qs.h_all()
+
+
+def bench_qft(qs):
+    qs.qft(list(range(qs.num_qubits)))
+
+
+def bench_probabilities(qs):
+    qs.probabilities()
+
+
+def bench_statevector(qs):
+    qs.get_statevector()
+
+
+BENCHMARKS = [
+    ("Single gate (H)", bench_single_gate),
+    ("CNOT", bench_cnot),
+    ("Rx", bench_rotation),
+    ("H on every qubit (loop)", bench_h_loop),
+    ("H on every qubit (h_all)", bench_h_all),
+    ("QFT (all qubits)", bench_qft),
+    ("probabilities()", bench_probabilities),
+    ("get_statevector()", bench_statevector),
+]
+
+
+def time_ns(fn, qs, repeat):
+    """Best-of-`repeat` wall time of one call, in nanoseconds"""
+    fn(qs)  # warm up (page in the state vector)
+    best = None
+    for _ in range(repeat):
+        start = perf_counter_ns()
+        fn(qs)
+        elapsed = perf_counter_ns() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def format_ns(ns):
+    if ns < 1_000:
+        return f"{ns} ns"
+    if ns < 1_000_000:
+        return f"{ns / 1_000:.1f} µs"
+    return f"{ns / 1_000_000:.2f} ms"
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="MacQ Python bridge benchmarks")
+    ap.add_argument("--qubits", type=int, nargs="+", default=[10, 20],
+                    help="state sizes to benchmark")
+    ap.add_argument("--repeat", type=int, default=20,
+                    help="timed calls per benchmark (best is reported)")
+    args = ap.parse_args(argv)
+
+    print(SEP)
+    print(f"MacQ Python Bridge Benchmarks ({version()})")
+    if __debug__:
+        print("note: run with `python -O` to strip asserts")
+    print(SEP)
+
+    header = f"{'Operation':<28}" + "".join(f"{n:>10}q" for n in args.qubits)
+    print(header)
+    print("-" * len(header))
+    states = {n: QuantumState(n) for n in args.qubits}
+    for name, fn in BENCHMARKS:
+        row = f"{name:<28}"
+        for n in args.qubits:
+            row += f"{format_ns(time_ns(fn, states[n], args.repeat)):>11}"
+        print(row)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,10 @@
+"""
+pytest configuration: make the repository root importable once per session
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = str(Path(__file__).resolve().parents[1])
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
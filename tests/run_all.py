@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Run every Python test script in tests/ in parallel.
+
+Each test_*.py file runs in its own interpreter, exactly as when it is
+run by hand, so scripts with module-level test code stay isolated.
+Use --serial to run them one at a time while debugging.
+
+--json PATH writes per-script results together with a hash of each
+script's inputs; passing a previous report via --since skips scripts
+that passed last time and whose inputs have not changed since.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(TESTS_DIR)
+
+
+def discover():
+    """Return the test scripts in tests/, sorted by name"""
+    return sorted(
+        os.path.join(TESTS_DIR, name)
+        for name in os.listdir(TESTS_DIR)
+        if name.startswith("test_") and name.endswith(".py")
+    )
+
+
+def _hash_files(paths):
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(os.path.relpath(path, ROOT).encode())
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def shared_inputs_hash():
+    """Hash of everything the scripts share: the macq package, the C
+    engine sources and the tests/_*.py helpers"""
+    paths = []
+    for top, exts in (("macq", (".py",)), ("c_engine", (".c", ".h"))):
+        for dirpath, dirnames, filenames in os.walk(os.path.join(ROOT, top)):
+            dirnames[:] = sorted(d for d in dirnames if d != "__pycache__")
+            paths.extend(os.path.join(dirpath, name)
+                         for name in sorted(filenames) if name.endswith(exts))
+    paths.extend(os.path.join(TESTS_DIR, name)
+                 for name in sorted(os.listdir(TESTS_DIR))
+                 if name.startswith("_") and name.endswith(".py"))
+    return _hash_files(paths)
+
+
+def load_report(path):
+    """Previous --json report, or an empty one if it is missing/invalid"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f).get("scripts", {})
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def run_script(path):
+    """Run one test script; return (path, returncode, output, seconds)"""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, path],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    return path, proc.returncode, proc.stdout, time.perf_counter() - start
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--serial", action="store_true",
+                    help="run scripts one at a time (for debugging)")
+    ap.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                    help="number of scripts to run at once")
+    ap.add_argument("-v", "--verbose", action="store_true",
+                    help="print output of passing scripts too")
+    ap.add_argument("--json", metavar="PATH",
+                    help="write per-script results and input hashes to PATH")
+    ap.add_argument("--since", metavar="PATH",
+                    help="skip scripts that passed in this earlier --json "
+                         "report and whose inputs are unchanged")
+    args = ap.parse_args(argv)
+
+    shared = shared_inputs_hash()
+    hashes = {
+        path: hashlib.sha256((_hash_files([path]) + shared).encode()).hexdigest()
+        for path in discover()
+    }
+    previous = load_report(args.since) if args.since else {}
+
+    scripts, skipped = [], {}
+    for path, digest in hashes.items():
+        entry = previous.get(os.path.basename(path))
+        if entry and entry.get("passed") and entry.get("inputs") == digest:
+            skipped[path] = entry
+        else:
+            scripts.append(path)
+
+    start = time.perf_counter()
+    if args.serial or args.jobs <= 1:
+        results = [run_script(path) for path in scripts]
+    else:
+        # The work happens in child interpreters, so threads are enough
+        # to keep all of them running at once.
+        with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+            results = list(pool.map(run_script, scripts))
+
+    failed = []
+    report = {os.path.basename(path): entry for path, entry in skipped.items()}
+    for path in skipped:
+        print(f"SKIP  {os.path.basename(path):<36} (unchanged)")
+    for path, code, output, seconds in results:
+        name = os.path.basename(path)
+        status = "PASS" if code == 0 else "FAIL"
+        print(f"{status}  {name:<36} {seconds:6.2f}s")
+        report[name] = {"passed": code == 0, "seconds": round(seconds, 3),
+                        "inputs": hashes[path]}
+        if code != 0:
+            failed.append(name)
+        if code != 0 or args.verbose:
+            print(output)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"scripts": dict(sorted(report.items()))}, f, indent=2)
+
+    elapsed = time.perf_counter() - start
+    print(f"\n{len(results) - len(failed)}/{len(results)} scripts passed "
+          f"in {elapsed:.2f}s" + (f", {len(skipped)} skipped" if skipped else ""))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
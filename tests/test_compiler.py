@@ -3,27 +3,36 @@
 Test script for Q-Lang compiler and decompiler
 """
 
+import copy
+import json
+import os
+import pickle
 import sys
-sys.path.insert(0, '/Volumes/External/Reaearch/quantum_eng')
+
+# Add parent directory to path (when run as a script)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from macq.qlang import QLangParser
 from macq.qlang.validator import QLangValidator
 from macq.qlang.compiler import QLangCompiler, QLangDecompiler
 
+SEP = "=" * 60
+
 parser = QLangParser()
+validator = QLangValidator(num_qubits=1)  # reset() per test
 compiler = QLangCompiler()
 decompiler = QLangDecompiler()
 
 # Test 1: Bell state
 print("Test 1: Bell state compilation")
-print("=" * 60)
+print(SEP)
 code1 = """
 H 0
 CNOT 0-1
 """
 ast1 = parser.parse(code1)
-validator1 = QLangValidator(num_qubits=2)
-validator1.validate(ast1)
+validator.reset(num_qubits=2)
+validator.validate(ast1)
 
 gates1 = compiler.compile(ast1)
 print("Compiled gates:")
@@ -37,15 +46,15 @@ print()
 
 # Test 2: Complex circuit
 print("Test 2: Complex circuit with parallel operations")
-print("=" * 60)
+print(SEP)
 code2 = """
 H 0, 2, 4; X 1, 3
 CNOT 0-1; CNOT 2-3
 Toffoli 0-1-2
 """
 ast2 = parser.parse(code2)
-validator2 = QLangValidator(num_qubits=5)
-validator2.validate(ast2)
+validator.reset(num_qubits=5)
+validator.validate(ast2)
 
 gates2 = compiler.compile(ast2)
 print("Compiled gates:")
@@ -59,15 +68,15 @@ print()
 
 # Test 3: Parametric gates
 print("Test 3: Parametric rotation gates")
-print("=" * 60)
+print(SEP)
 code3 = """
 Rx(3.14159/2) 0
 Ry(π/4) 1
 Rz(1.5708) 2
 """
 ast3 = parser.parse(code3)
-validator3 = QLangValidator(num_qubits=3)
-validator3.validate(ast3)
+validator.reset(num_qubits=3)
+validator.validate(ast3)
 
 gates3 = compiler.compile(ast3)
 print("Compiled gates:")
@@ -78,4 +87,36 @@ print("\nDecompiled code:")
 decompiled3 = decompiler.decompile(gates3)
 print(decompiled3)
 
+print()
+
+# Test 4: Compiled gates copy, pickle and serialize like plain dicts did
+print("Test 4: Copying and serializing compiled gates")
+print(SEP)
+copied = copy.deepcopy(gates1)
+assert copied == gates1
+assert pickle.loads(pickle.dumps(gates2)) == gates2
+assert json.loads(json.dumps(gates1)) == [list(gate) for gate in gates1]
+assert copied[0]['params'] == {}
+try:
+    gates1[0]['params']['angle'] = 1.0
+except TypeError:
+    pass
+else:
+    raise AssertionError("shared empty params must be read-only")
+print("deepcopy / pickle / json round-trips OK")
+print()
+
+# Test 5: Gate records read like the compiler's former gate dicts
+print("Test 5: Gate records as mappings")
+print(SEP)
+h_gate, cnot_gate = gates1
+assert dict(h_gate) == {'type': 'H', 'qubit': 0, 'time_step': 0,
+                        'control': None, 'params': {}}
+assert dict(cnot_gate.items())['control'] == 0
+assert 'control' in h_gate and h_gate.get('control', -1) is None
+toffoli_gate = gates2[-1]
+assert 'control2' not in h_gate and h_gate.get('control2', -1) == -1
+assert toffoli_gate.get('control2') == 1 and 'control2' in toffoli_gate.keys()
+print("dict(), keys/items, get and membership OK")
+
 print("\n✅ All compiler tests completed!")
@@ -4,20 +4,26 @@ Test Q-Lang v2.0 classical control flow (if-then)
 """
 
 import sys
-sys.path.insert(0, '/Volumes/External/Reaearch/quantum_eng')
+import os
+
+# Add parent directory to path (when run as a script)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from macq.qlang import QLangParser
 
+SEP = "=" * 70
+SUB = "-" * 70
+
 parser = QLangParser()
 
-print("=" * 70)
+print(SEP)
 print("Q-LANG V2.0 CLASSICAL CONTROL FLOW TEST")
-print("=" * 70)
+print(SEP)
 print()
 
 # Test 1: Simple conditional
 print("Test 1: Simple if-then")
-print("-" * 70)
+print(SUB)
 code1 = """
 measure 0 -> c0
 if c0 then X 1
@@ -32,7 +38,7 @@ except Exception as e:
 
 # Test 2: Conditional with explicit comparison
 print("Test 2: if c0 == 1 then")
-print("-" * 70)
+print(SUB)
 code2 = """
 measure 0 -> c0
 if c0 == 1 then Z 1
@@ -49,7 +55,7 @@ except Exception as e:
 
 # Test 3: AND condition
 print("Test 3: Logical AND")
-print("-" * 70)
+print(SUB)
 code3 = """
 measure 0 -> c0
 measure 1 -> c1
@@ -65,7 +71,7 @@ except Exception as e:
 
 # Test 4: Quantum Teleportation with conditionals
 print("Test 4: Quantum Teleportation (Complete!)")
-print("-" * 70)
+print(SUB)
 teleportation = """
 # Quantum Teleportation - NOW COMPLETE!
 H 1
@@ -89,7 +95,7 @@ except Exception as e:
 
 # Test 5: Complex OR condition
 print("Test 5: Logical OR")
-print("-" * 70)
+print(SUB)
 code5 = """
 measure 0 -> c0
 measure 1 -> c1
@@ -103,15 +109,17 @@ try:
 except Exception as e:
     print(f"❌ Error: {e}\n")
 
-print("=" * 70)
-print("✨ CLASSICAL CONTROL FLOW TEST COMPLETE!")
-print("=" * 70)
-print()
-print("Q-Lang v2.0 now supports:")
-print("  ✅ Measurements (measure qubit -> classical_bit)")
-print("  ✅ Simple conditionals (if c0 then X 1)")
-print("  ✅ Explicit comparisons (if c0 == 1 then ...)")
-print("  ✅ Logical AND (if c0 and c1 then ...)")
-print("  ✅ Logical OR (if c0 or c1 then ...)")
-print()
-print("🎯 Next: C bridge integration + GUI updates!")
+sys.stdout.write("\n".join([
+    SEP,
+    "✨ CLASSICAL CONTROL FLOW TEST COMPLETE!",
+    SEP,
+    "",
+    "Q-Lang v2.0 now supports:",
+    "  ✅ Measurements (measure qubit -> classical_bit)",
+    "  ✅ Simple conditionals (if c0 then X 1)",
+    "  ✅ Explicit comparisons (if c0 == 1 then ...)",
+    "  ✅ Logical AND (if c0 and c1 then ...)",
+    "  ✅ Logical OR (if c0 or c1 then ...)",
+    "",
+    "🎯 Next: C bridge integration + GUI updates!",
+]) + "\n")
@@ -4,15 +4,20 @@ Test measurement syntax in Q-Lang v2.0
 """
 
 import sys
-sys.path.insert(0, '/Volumes/External/Reaearch/quantum_eng')
+import os
+
+# Add parent directory to path (when run as a script)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from macq.qlang import QLangParser
 
+SEP = "=" * 60
+
 parser = QLangParser()
 
 # Test 1: Simple measurement
 print("Test 1: Simple measurement")
-print("=" * 60)
+print(SEP)
 code1 = """
 H 0
 measure 0 -> c0
@@ -27,7 +32,7 @@ print()
 
 # Test 2: Bell state with measurement
 print("Test 2: Bell state with measurements")
-print("=" * 60)
+print(SEP)
 code2 = """
 H 0
 CNOT 0-1
@@ -44,7 +49,7 @@ print()
 
 # Test 3: Parallel gates and measurement
 print("Test 3: Mixed operations")
-print("=" * 60)
+print(SEP)
 code3 = """
 H 0, 1
 CNOT 0-1; measure 2 -> c2
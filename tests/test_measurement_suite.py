@@ -5,20 +5,26 @@ Tests parsing and AST generation for measurement operations
 """
 
 import sys
-sys.path.insert(0, '/Volumes/External/Reaearch/quantum_eng')
+import os
+
+# Add parent directory to path (when run as a script)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from macq.qlang import QLangParser
 
-print("=" * 70)
+SEP = "=" * 70
+SUB = "-" * 70
+
+print(SEP)
 print("Q-LANG V2.0 MEASUREMENT FEATURE TEST SUITE")
-print("=" * 70)
+print(SEP)
 print()
 
 parser = QLangParser()
 
 # Test 1: Quantum Teleportation Protocol (requires measurement)
 print("📡 Test 1: Quantum Teleportation Circuit")
-print("-" * 70)
+print(SUB)
 teleportation_code = """
 # Quantum Teleportation Protocol
 # Step 1: Create Bell pair between Alice and Bob
@@ -51,7 +57,7 @@ except Exception as e:
 
 # Test 2: Deutsch Algorithm (measurement at end)
 print("🔬 Test 2: Deutsch Algorithm")
-print("-" * 70)
+print(SUB)
 deutsch_code = """
 # Deutsch Algorithm: Determine if function is constant or balanced
 # Initialize
@@ -77,7 +83,7 @@ except Exception as e:
 
 # Test 3: Mixed parallel operations with measurements
 print("⚡ Test 3: Parallel Gates and Measurements")
-print("-" * 70)
+print(SUB)
 parallel_code = """
 # Mixed parallel operations
 H 0, 1, 2
@@ -97,7 +103,7 @@ except Exception as e:
 
 # Test 4: Error handling - invalid classical bit name
 print("🚫 Test 4: Error Handling - Missing arrow")
-print("-" * 70)
+print(SUB)
 error_code1 = """
 H 0
 measure 0 c0
@@ -111,7 +117,7 @@ print()
 
 # Test 5: Multiple measurements in sequence
 print("🔢 Test 5: Sequential Measurements")
-print("-" * 70)
+print(SUB)
 sequential_code = """
 # Measure all qubits sequentially
 measure 0 -> c0
@@ -129,19 +135,21 @@ except Exception as e:
     print(f"❌ Error: {e}\n")
 
 # Summary
-print("=" * 70)
-print("✨ TEST SUITE COMPLETE!")
-print("=" * 70)
-print()
-print("📊 Summary:")
-print("  ✅ Measurement syntax parsing: WORKING")
-print("  ✅ Classical bit assignment: WORKING")
-print("  ✅ Parallel measurements: WORKING")
-print("  ✅ Error detection: WORKING")
-print()
-print("🎯 Next Steps:")
-print("  1. ⏳ Implement C bridge for actual measurements")
-print("  2. ⏳ Add classical control flow (if-then)")
-print("  3. ⏳ GUI display for measurement results")
-print()
-print("Ready for Phase 2: Classical Control Flow! 🚀")
+sys.stdout.write("\n".join([
+    SEP,
+    "✨ TEST SUITE COMPLETE!",
+    SEP,
+    "",
+    "📊 Summary:",
+    "  ✅ Measurement syntax parsing: WORKING",
+    "  ✅ Classical bit assignment: WORKING",
+    "  ✅ Parallel measurements: WORKING",
+    "  ✅ Error detection: WORKING",
+    "",
+    "🎯 Next Steps:",
+    "  1. ⏳ Implement C bridge for actual measurements",
+    "  2. ⏳ Add classical control flow (if-then)",
+    "  3. ⏳ GUI display for measurement results",
+    "",
+    "Ready for Phase 2: Classical Control Flow! 🚀",
+]) + "\n")
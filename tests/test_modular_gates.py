@@ -5,30 +5,28 @@ For Shor's Algorithm implementation
 """
 
 import sys
-sys.path.insert(0, '/Volumes/External/Reaearch/quantum_eng')
+import os
+
+# Add parent directory to path (when run as a script)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from macq.qlang import QLangParser
+from _circuits import shor_template
+
+SEP = "=" * 70
+SUB = "-" * 70
 
 parser = QLangParser()
 
-print("="*70)
+print(SEP)
 print("Q-LANG V2.0 MODULAR ARITHMETIC GATES TEST")
-print("="*70)
+print(SEP)
 print()
 
 # Test 1: MOD_EXP for Shor's algorithm
 print("Test 1: MOD_EXP gate (Shor's algorithm core)")
-print("-"*70)
-shor_code = """
-# Shor's Algorithm: Factor N=15 using a=7
-# Initialize superposition in control register
-H 0, 1, 2, 3
-
-# Modular exponentiation: |x⟩|1⟩ → |x⟩|7^x mod 15⟩
-# Control: qubits 0-3 (4-bit input)
-# Target: qubits 4-7 (4-bit output)
-MOD_EXP(7, 15) 0,1,2,3-4,5,6,7
-"""
+print(SUB)
+shor_code = shor_template(15, 7, 4, 4)
 
 try:
     ast = parser.parse(shor_code)
@@ -42,7 +40,7 @@ except Exception as e:
 
 # Test 2: Multiple modular gates
 print("Test 2: Multiple MOD_EXP with different parameters")
-print("-"*70)
+print(SUB)
 multi_code = """
 MOD_EXP(2, 5) 0,1-2,3
 MOD_EXP(3, 7) 4,5,6-7,8,9
@@ -60,7 +58,7 @@ except Exception as e:
 
 # Test 3: Simplified Shor's factorization of 15
 print("Test 3: Complete Shor's Algorithm Template (15=3×5)")
-print("-"*70)
+print(SUB)
 shor_complete = """
 # Shor's Algorithm to factor N=15
 # Using 8 qubits total: 4 for input, 4 for output
@@ -96,7 +94,7 @@ except Exception as e:
 
 # Test 4: Error detection
 print("Test 4: Error Detection - Invalid parameters")
-print("-"*70)
+print(SUB)
 
 # Test 4a: Missing parameters
 error_code1 = "MOD_EXP(7) 0-1"
@@ -114,21 +112,22 @@ try:
     print("❌ Should have failed - non-integer base")
 except SyntaxError as e:
     print(f"✅ Correctly caught error: {str(e)[:80]}...")
-print()
-
-print("="*70)
-print("MODULAR ARITHMETIC GATES TEST COMPLETE!")
-print("="*70)
-print()
-print("✅ Phase 4 Complete:")
-print("   • MOD_EXP gate parsing: WORKING")
-print("   • Multi-register support: WORKING")
-print("   • Parameter validation: WORKING")
-print()
-print("🎯 Shor's algorithm now 80% complete!")
-print("   ✅ Superposition initialization")
-print("   ✅ Modular exponentiation  ")
-print("   ✅ Measurements")
-print("   ⏳ QFT (Phase 5)")
-print()
-print("Next: Phase 5 - Quantum Fourier Transform! 🚀")
+sys.stdout.write("\n".join([
+    "",
+    SEP,
+    "MODULAR ARITHMETIC GATES TEST COMPLETE!",
+    SEP,
+    "",
+    "✅ Phase 4 Complete:",
+    "   • MOD_EXP gate parsing: WORKING",
+    "   • Multi-register support: WORKING",
+    "   • Parameter validation: WORKING",
+    "",
+    "🎯 Shor's algorithm now 80% complete!",
+    "   ✅ Superposition initialization",
+    "   ✅ Modular exponentiation  ",
+    "   ✅ Measurements",
+    "   ⏳ QFT (Phase 5)",
+    "",
+    "Next: Phase 5 - Quantum Fourier Transform! 🚀",
+]) + "\n")
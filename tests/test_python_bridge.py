@@ -10,7 +10,9 @@ import numpy as np
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from macq import QuantumState, version
+from macq import GateType, QuantumState, version
+
+SEP = "=" * 50
 
 def test_version():
     """Test library version"""
@@ -45,16 +47,47 @@ def test_single_qubit_gates():
 def test_bell_state():
     """Test Bell state creation"""
     qs = QuantumState(2)
-    qs.h(0).cnot(0, 1)
+    qs.apply_gates([(GateType.GATE_H, 0), (GateType.GATE_CX, 0, 1)])
     
     probs = qs.probabilities()
-    assert abs(probs[0] - 0.5) < 1e-6  # |00⟩
-    assert abs(probs[3] - 0.5) < 1e-6  # |11⟩
-    assert abs(probs[1]) < 1e-6  # |01⟩
-    assert abs(probs[2]) < 1e-6  # |10⟩
+    expected = np.array([0.5, 0.0, 0.0, 0.5])  # |00⟩, |01⟩, |10⟩, |11⟩
+    assert np.allclose(probs, expected, atol=1e-6)
     
     print(f"✓ Bell state: P(|00⟩)={probs[0]:.3f}, P(|11⟩)={probs[3]:.3f}")
 
+def test_gate_sequence():
+    """Test batched gates against the single-gate methods"""
+    seq = QuantumState(3)
+    seq.apply_gates([
+        (GateType.GATE_H, 0),
+        (GateType.GATE_RX, 1, 0.7),
+        (GateType.GATE_RZ, 0, 1.1),
+        (GateType.GATE_CCX, 0, 1, 2),
+        (GateType.GATE_SWAP, 0, 2),
+    ])
+    ref = QuantumState(3)
+    ref.h(0).rx(1, 0.7).rz(0, 1.1).toffoli(0, 1, 2).swap(0, 2)
+    assert np.allclose(seq.get_statevector(), ref.get_statevector())
+    
+    # Bad entries are rejected before anything is applied
+    before = seq.get_statevector()
+    for bad in ([(GateType.GATE_H, 0), (GateType.GATE_CY, 0, 1)],
+                [(GateType.GATE_H, 0), (GateType.GATE_SDG, 1)],
+                [(GateType.GATE_H, 0), (GateType.GATE_X, 3)],
+                [(GateType.GATE_H, 0), (GateType.GATE_CX, 1, 1)],
+                [(GateType.GATE_H, 0), (GateType.GATE_CCX, 0, 0, 1)],
+                [(GateType.GATE_H, 0), (GateType.GATE_CCX, 0, 1, 1)],
+                [(GateType.GATE_H, 0), (GateType.GATE_CCX, 0, 1, 0)],
+                [(GateType.GATE_H, 0), (GateType.GATE_RY, 1)]):
+        try:
+            seq.apply_gates(bad)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"apply_gates accepted {bad}")
+        assert np.array_equal(seq.get_statevector(), before)
+    print("✓ Gate sequence: matches single-gate calls, bad entries rejected")
+
 def test_statevector():
     """Test statevector extraction"""
     qs = QuantumState(2)
@@ -65,40 +98,80 @@ def test_statevector():
     assert np.allclose(np.abs(vec), 0.5)
     print(f"✓ Statevector: {vec}")
 
+def test_probabilities_array():
+    """Test shared read-only probability array"""
+    qs = QuantumState(2)
+    qs.h(0)
+    
+    probs = qs.probabilities_array
+    assert probs is qs.probabilities_array  # cached until the state changes
+    assert not probs.flags.writeable
+    assert np.allclose(probs, qs.probabilities())
+    
+    qs.cnot(0, 1)
+    assert np.allclose(qs.probabilities_array, [0.5, 0, 0, 0.5])
+    out = np.empty(4)
+    assert qs.probabilities_into(out) is out
+    assert np.allclose(out, [0.5, 0, 0, 0.5])
+    assert np.allclose(qs.amplitudes_array, qs.get_statevector())
+    print(f"✓ Probabilities array: {qs.probabilities_array}")
+
 def test_measurement():
     """Test measurement"""
     qs = QuantumState(1)
     qs.h(0)
     
     # Measure many times
-    results = [qs.clone().measure(0) for _ in range(100)]
-    ones = sum(results)
+    results = qs.sample(0, 100)
+    zeros, ones = np.bincount(results, minlength=2).tolist()
+    assert zeros + ones == 100
     ratio = ones / 100
     
     assert 0.3 < ratio < 0.7  # Should be ~50%
+    
+    # sample() leaves the state alone; measure() collapses it
+    assert np.isclose(qs.probability(0), 0.5)
+    collapsed = qs.clone()
+    outcome = collapsed.measure(0)
+    assert outcome in (0, 1)
+    assert np.isclose(collapsed.probability(0), outcome)
+    
+    for bad_qubit, bad_shots in ((1, 10), (-1, 10), (0, -1)):
+        try:
+            qs.sample(bad_qubit, bad_shots)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"sample({bad_qubit}, {bad_shots}) should raise")
+    assert qs.sample(0, 0).shape == (0,)
     print(f"✓ Measurement: {ones}/100 ones ({ratio:.1%})")
 
 def test_multi_qubit():
     """Test larger state"""
     qs = QuantumState(10)
-    for i in range(10):
-        qs.h(i)
+    qs.h_all()
     
     probs = qs.probabilities()
     assert np.allclose(probs, 1.0/1024)
+    
+    probs32 = qs.probabilities(dtype=np.float32)
+    assert probs32.dtype == np.float32
+    assert np.allclose(probs32, 1.0/1024, atol=1e-5)
     print(f"✓ 10-qubit uniform superposition: all probs ≈ {1/1024:.6f}")
 
 if __name__ == '__main__':
-    print("=" * 50)
+    print(SEP)
     print("MacQ Python Bridge Test Suite")
-    print("=" * 50)
+    print(SEP)
     
     tests = [
         test_version,
         test_create_state,
         test_single_qubit_gates,
         test_bell_state,
+        test_gate_sequence,
         test_statevector,
+        test_probabilities_array,
         test_measurement,
         test_multi_qubit
     ]
@@ -110,6 +183,6 @@ if __name__ == '__main__':
             print(f"✗ {test.__name__} FAILED: {e}")
             sys.exit(1)
     
-    print("=" * 50)
+    print(SEP)
     print("All tests passed! ✓")
-    print("=" * 50)
+    print(SEP)
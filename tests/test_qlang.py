@@ -4,15 +4,21 @@ Test script for Q-Lang parser
 """
 
 import sys
-sys.path.insert(0, '/Volumes/External/Reaearch/quantum_eng')
+import os
+
+# Add parent directory to path (when run as a script)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from macq.qlang import QLangParser
+from macq.qlang.parser import SingleQubitGate
+
+SEP = "=" * 60
 
 parser = QLangParser()
 
 # Test 1: Bell state
 print("Test 1: Bell state")
-print("=" * 60)
+print(SEP)
 code1 = """
 H 0
 CNOT 0-1
@@ -23,7 +29,7 @@ print()
 
 # Test 2: Parallel operations
 print("Test 2: Parallel operations")
-print("=" * 60)
+print(SEP)
 code2 = "H 0, 2; X 1; CNOT 0-1"
 ast2 = parser.parse(code2)
 print(ast2)
@@ -31,7 +37,7 @@ print()
 
 # Test 3: GHZ state
 print("Test 3: GHZ state")
-print("=" * 60)
+print(SEP)
 code3 = """
 H 0
 CNOT 0-1
@@ -43,7 +49,7 @@ print()
 
 # Test 4: Parametric gates
 print("Test 4: Parametric rotation gates")
-print("=" * 60)
+print(SEP)
 code4 = """
 Rx(3.14159/2) 0
 Ry(π/4) 1
@@ -55,7 +61,7 @@ print()
 
 # Test 5: Complex circuit
 print("Test 5: Complex circuit")
-print("=" * 60)
+print(SEP)
 code5 = """
 # Initialize
 H 0, 2, 4; X 1, 3
@@ -68,5 +74,14 @@ Toffoli 0-1-2
 """
 ast5 = parser.parse(code5)
 print(ast5)
+print()
+
+# Test 6: Parsed nodes equal hand-built ones
+print("Test 6: Parsed node equality")
+print(SEP)
+gate = parser.parse("H 0, 1").time_steps[0].operations[0]
+assert type(gate.qubits) is list and gate.qubits == [0, 1]
+assert gate == SingleQubitGate('H', [0, 1], None, gate.line, gate.column)
+print(gate)
 
 print("\n✅ All tests passed!")
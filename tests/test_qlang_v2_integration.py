@@ -5,22 +5,26 @@ Tests all features: gates, measurements, conditionals, and complex algorithms
 """
 
 import sys
-sys.path.insert(0, '/Volumes/External/Reaearch/quantum_eng')
+import os
+
+# Add parent directory to path (when run as a script)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from macq.qlang import QLangParser
 from macq.qlang.validator import QLangValidator, ValidationError
 
-print("="*80)
+SEP = "=" * 80
+SUB = "-" * 80
+
+print(SEP)
 print("Q-LANG V2.0 COMPREHENSIVE INTEGRATION TEST")
-print("="*80)
+print(SEP)
 print()
 
 parser = QLangParser()
+validator = QLangValidator(num_qubits=1)  # reset() per program
 
-# Test 1: Quantum Teleportation - The Complete Protocol
-print("🌟 Test 1: Quantum Teleportation (Complete Protocol)")
-print("-"*80)
-teleportation = """
+TELEPORTATION = """
 # Quantum Teleportation: Transfer quantum state from q0 to q2 via entanglement
 # Step 1: Create Bell pair (q1, q2) shared between Alice and Bob
 H 1
@@ -41,20 +45,7 @@ if c0 then Z 2
 # Result: State of q0 is now transferred to q2!
 """
 
-try:
-    ast = parser.parse(teleportation)
-    validator = QLangValidator(num_qubits=3)
-    validator.validate(ast)
-    print("✅ PASSED - Quantum Teleportation")
-    print(f"   Time steps: {len(ast.time_steps)}")
-    print()
-except Exception as e:
-    print(f"❌ FAILED: {e}\n")
-
-# Test 2: Deutsch-Jozsa Algorithm
-print("🔬 Test 2: Deutsch-Jozsa Algorithm")
-print("-"*80)
-deutsch_jozsa = """
+DEUTSCH_JOZSA = """
 # Deutsch-Jozsa: Determine if function is constant or balanced (2-qubit version)
 # Initialize qubits
 X 1
@@ -71,19 +62,7 @@ measure 0 -> c0
 # If c0 == 1: function is balanced
 """
 
-try:
-    ast = parser.parse(deutsch_jozsa)
-    validator = QLangValidator(num_qubits=2)
-    validator.validate(ast)
-    print("✅ PASSED - Deutsch-Jozsa Algorithm")
-    print()
-except Exception as e:
-    print(f"❌ FAILED: {e}\n")
-
-# Test 3: Superdense Coding
-print("📡 Test 3: Superdense Coding (2 classical bits via 1 qubit)")
-print("-"*80)
-superdense_coding = """
+SUPERDENSE_CODING = """
 # Superdense Coding: Alice sends 2 classical bits using 1 qubit
 # Step 1: Create Bell pair
 H 0
@@ -106,19 +85,7 @@ measure 1 -> c1
 # Result: (c0, c1) = (1, 1)
 """
 
-try:
-    ast = parser.parse(superdense_coding)
-    validator = QLangValidator(num_qubits=2)
-    validator.validate(ast)
-    print("✅ PASSED - Superdense Coding")
-    print()
-except Exception as e:
-    print(f"❌ FAILED: {e}\n")
-
-# Test 4: GHZ State with Measurements
-print("⚛️  Test 4: GHZ State Preparation and Measurement")
-print("-"*80)
-ghz = """
+GHZ = """
 # GHZ state: Maximum entanglement of 3 qubits
 H 0
 CNOT 0-1
@@ -132,19 +99,7 @@ measure 2 -> c2
 # Result: Either all 0 or all 1 (50% each)
 """
 
-try:
-    ast = parser.parse(ghz)
-    validator = QLangValidator(num_qubits=3)
-    validator.validate(ast)
-    print("✅ PASSED - GHZ State")
-    print()
-except Exception as e:
-    print(f"❌ FAILED: {e}\n")
-
-# Test 5: Complex Conditional Logic
-print("🧠 Test 5: Complex Conditional Logic (AND/OR)")
-print("-"*80)
-complex_conditional = """
+COMPLEX_CONDITIONAL = """
 # Test all logical operators
 H 0, 1, 2
 measure 0 -> c0
@@ -162,19 +117,7 @@ if c0 == 1 then Z 5
 if c2 == 0 then H 6
 """
 
-try:
-    ast = parser.parse(complex_conditional)
-    validator = QLangValidator(num_qubits=7)
-    validator.validate(ast)
-    print("✅ PASSED - Complex Conditional Logic")
-    print()
-except Exception as e:
-    print(f"❌ FAILED: {e}\n")
-
-# Test 6: Mixed Operations
-print("⚡ Test 6: Mixed Parallel Operations")
-print("-"*80)
-mixed = """
+MIXED = """
 # Kitchen sink: everything at once
 H 0, 1; X 2; measure 3 -> c3
 CNOT 0-1; if c3 then Y 4
@@ -182,18 +125,32 @@ Rx(π/4) 5; Ry(π/2) 6; measure 7 -> c7
 if c3 and c7 then Toffoli 0-1-2
 """
 
-try:
-    ast = parser.parse(mixed)
-    validator = QLangValidator(num_qubits=8)
-    validator.validate(ast)
-    print("✅ PASSED - Mixed Parallel Operations")
-    print()
-except Exception as e:
-    print(f"❌ FAILED: {e}\n")
+# (header, pass label, source, num_qubits)
+PROGRAMS = [
+    ("🌟 Test 1: Quantum Teleportation (Complete Protocol)", "Quantum Teleportation", TELEPORTATION, 3),
+    ("🔬 Test 2: Deutsch-Jozsa Algorithm", "Deutsch-Jozsa Algorithm", DEUTSCH_JOZSA, 2),
+    ("📡 Test 3: Superdense Coding (2 classical bits via 1 qubit)", "Superdense Coding", SUPERDENSE_CODING, 2),
+    ("⚛️  Test 4: GHZ State Preparation and Measurement", "GHZ State", GHZ, 3),
+    ("🧠 Test 5: Complex Conditional Logic (AND/OR)", "Complex Conditional Logic", COMPLEX_CONDITIONAL, 7),
+    ("⚡ Test 6: Mixed Parallel Operations", "Mixed Parallel Operations", MIXED, 8),
+]
+
+for header, label, source, num_qubits in PROGRAMS:
+    print(header)
+    print(SUB)
+    try:
+        ast = parser.parse(source)
+        validator.reset(num_qubits)
+        validator.validate(ast)
+        print(f"✅ PASSED - {label}")
+        print(f"   Time steps: {len(ast.time_steps)}")
+        print()
+    except Exception as e:
+        print(f"❌ FAILED: {e}\n")
 
 # Test 7: Error Detection
 print("🚫 Test 7: Error Detection")
-print("-"*80)
+print(SUB)
 
 # Test 7a: Qubit reuse in conditional
 error_code_1 = """
@@ -202,34 +159,34 @@ if c0 then CNOT 0-0
 """
 try:
     ast = parser.parse(error_code_1)
-    validator = QLangValidator(num_qubits=5)
+    validator.reset(5)
     validator.validate(ast)
     print("❌ FAILED - Should have detected control=target error")
 except ValidationError as e:
     print(f"✅ PASSED - Correctly detected error: {e}")
 except Exception as e:
     print(f"❌ FAILED - Wrong error type: {e}")
-print()
-
-# Summary
-print("="*80)
-print("INTEGRATION TEST SUMMARY")
-print("="*80)
-print()
-print("✅ Q-Lang v2.0 Features All Working:")
-print("   • Basic quantum gates (H, X, Y, Z, CNOT, etc.)")
-print("   • Parametric gates (Rx, Ry, Rz)")
-print("   • Multi-qubit gates (Toffoli, CCZ)")
-print("   • Measurements (measure qubit -> classical_bit)")
-print("   • Conditional gates (if condition then gate)")
-print("   • Logical operators (and, or)")
-print("   • Bit comparisons (c0 == 0, c1 == 1)")
-print("   • Parallel operations (H 0, 1; X 2)")
-print()
-print("🎯 Implemented Algorithms:")
-print("   ✅ Quantum Teleportation")
-print("   ✅ Deutsch-Jozsa")
-print("   ✅ Superdense Coding")
-print("   ✅ GHZ State Preparation")
-print()
-print("🚀 Ready for GUI integration and further development!")
+sys.stdout.write("\n".join([
+    "",
+    SEP,
+    "INTEGRATION TEST SUMMARY",
+    SEP,
+    "",
+    "✅ Q-Lang v2.0 Features All Working:",
+    "   • Basic quantum gates (H, X, Y, Z, CNOT, etc.)",
+    "   • Parametric gates (Rx, Ry, Rz)",
+    "   • Multi-qubit gates (Toffoli, CCZ)",
+    "   • Measurements (measure qubit -> classical_bit)",
+    "   • Conditional gates (if condition then gate)",
+    "   • Logical operators (and, or)",
+    "   • Bit comparisons (c0 == 0, c1 == 1)",
+    "   • Parallel operations (H 0, 1; X 2)",
+    "",
+    "🎯 Implemented Algorithms:",
+    "   ✅ Quantum Teleportation",
+    "   ✅ Deutsch-Jozsa",
+    "   ✅ Superdense Coding",
+    "   ✅ GHZ State Preparation",
+    "",
+    "🚀 Ready for GUI integration and further development!",
+]) + "\n")
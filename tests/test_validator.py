@@ -4,24 +4,30 @@ Test script for Q-Lang validator
 """
 
 import sys
-sys.path.insert(0, '/Volumes/External/Reaearch/quantum_eng')
+import os
+
+# Add parent directory to path (when run as a script)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from macq.qlang import QLangParser
 from macq.qlang.validator import QLangValidator, ValidationError
 
+SEP = "=" * 60
+
 parser = QLangParser()
+validator = QLangValidator(num_qubits=1)  # reset() per test
 
 # Test 1: Valid Bell state
 print("Test 1: Valid Bell state")
-print("=" * 60)
+print(SEP)
 code1 = """
 H 0
 CNOT 0-1
 """
 ast1 = parser.parse(code1)
-validator1 = QLangValidator(num_qubits=2)
+validator.reset(num_qubits=2)
 try:
-    validator1.validate(ast1)
+    validator.validate(ast1)
     print("✅ Validation passed!")
 except ValidationError as e:
     print(f"❌ Validation failed: {e}")
@@ -29,12 +35,12 @@ print()
 
 # Test 2: Error - Qubit out of range
 print("Test 2: Error - Qubit out of range")
-print("=" * 60)
+print(SEP)
 code2 = "H 5"
 ast2 = parser.parse(code2)
-validator2 = QLangValidator(num_qubits=3)
+validator.reset(num_qubits=3)
 try:
-    validator2.validate(ast2)
+    validator.validate(ast2)
     print("✅ Validation passed!")
 except ValidationError as e:
     print(f"❌ Validation failed: {e}")
@@ -42,12 +48,12 @@ print()
 
 # Test 3: Error - Same qubit used twice in time step
 print("Test 3: Error - Same qubit used twice")
-print("=" * 60)
+print(SEP)
 code3 = "H 0; X 0"
 ast3 = parser.parse(code3)
-validator3 = QLangValidator(num_qubits=3)
+validator.reset(num_qubits=3)
 try:
-    validator3.validate(ast3)
+    validator.validate(ast3)
     print("✅ Validation passed!")
 except ValidationError as e:
     print(f"❌ Validation failed: {e}")
@@ -55,12 +61,12 @@ print()
 
 # Test 4: Error - Control = Target
 print("Test 4: Error - Control = Target")
-print("=" * 60)
+print(SEP)
 code4 = "CNOT 0-0"
 ast4 = parser.parse(code4)
-validator4 = QLangValidator(num_qubits=3)
+validator.reset(num_qubits=3)
 try:
-    validator4.validate(ast4)
+    validator.validate(ast4)
     print("✅ Validation passed!")
 except ValidationError as e:
     print(f"❌ Validation failed: {e}")
@@ -68,12 +74,12 @@ print()
 
 # Test 5: Valid parallel operations
 print("Test 5: Valid parallel operations")
-print("=" * 60)
+print(SEP)
 code5 = "H 0, 2; X 1; CNOT 3-4"
 ast5 = parser.parse(code5)
-validator5 = QLangValidator(num_qubits=5)
+validator.reset(num_qubits=5)
 try:
-    validator5.validate(ast5)
+    validator.validate(ast5)
     print("✅ Validation passed!")
 except ValidationError as e:
     print(f"❌ Validation failed: {e}")
@@ -81,16 +87,16 @@ print()
 
 # Test 6: Complex valid circuit
 print("Test 6: Complex valid circuit")
-print("=" * 60)
+print(SEP)
 code6 = """
 H 0, 2, 4; X 1, 3
 CNOT 0-1; CNOT 2-3
 Toffoli 0-1-2
 """
 ast6 = parser.parse(code6)
-validator6 = QLangValidator(num_qubits=5)
+validator.reset(num_qubits=5)
 try:
-    validator6.validate(ast6)
+    validator.validate(ast6)
     print("✅ Validation passed!")
 except ValidationError as e:
     print(f"❌ Validation failed: {e}")
@@ -265,7 +265,9 @@ async function runCircuit() {
 
     try {
         // Call Python backend
-        const response = await fetch('http://localhost:8080/execute', {
+        // Only probabilities and the Bloch vector are drawn, so skip the
+        // full state vector in the response
+        const response = await fetch('http://localhost:8080/execute?state_vector=0', {
             method: 'POST',
             headers: { 'Content-Type': 'application/json' },
             body: JSON.stringify({
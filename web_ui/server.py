@@ -3,20 +3,143 @@ MacQ Web Server - Flask Backend
 Connects WebGL frontend to C quantum engine
 """
 
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, Response, request, jsonify, send_from_directory
 from flask_cors import CORS
+import base64
+import math
 import sys
 import os
+import threading
 import numpy as np
 
+try:
+    import orjson  # optional: much faster JSON for large requests/responses
+except ImportError:
+    orjson = None
+
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from macq import QuantumState
+from macq import GateType, QuantumState
 
 app = Flask(__name__, static_folder='.')
 CORS(app)  # Enable CORS for local development
 
+# Frontend gate name -> engine gate type; two-qubit gates act on
+# (qubit, qubit + 1 mod n)
+SINGLE_QUBIT_GATES = {
+    'H': GateType.GATE_H,
+    'X': GateType.GATE_X,
+    'Y': GateType.GATE_Y,
+    'Z': GateType.GATE_Z,
+    'S': GateType.GATE_S,
+    'T': GateType.GATE_T,
+}
+TWO_QUBIT_GATES = {
+    'CNOT': GateType.GATE_CX,
+    'CZ': GateType.GATE_CZ,
+    'SWAP': GateType.GATE_SWAP,
+}
+
+
+def build_gate_sequence(gates, num_qubits):
+    """
+    Translate the frontend gate list into QuantumState.apply_gates() entries.
+
+    Unknown gate names are ignored, and gates the engine would reject
+    (bad qubit index, CNOT onto itself) are reported and skipped, so one
+    bad gate does not stop the rest of the circuit.
+    """
+    sequence = []
+    for gate_info in gates:
+        gate_type = gate_info['gate']
+        qubit = gate_info['qubit']
+
+        if gate_type not in SINGLE_QUBIT_GATES and gate_type not in TWO_QUBIT_GATES:
+            continue
+        if not isinstance(qubit, int) or not 0 <= qubit < num_qubits:
+            print(f"Error applying gate {gate_type}: invalid qubit {qubit!r}")
+            continue
+
+        if gate_type in SINGLE_QUBIT_GATES:
+            sequence.append((SINGLE_QUBIT_GATES[gate_type], qubit))
+            continue
+        # Simple: use qubit and qubit+1
+        target = (qubit + 1) % num_qubits
+        if gate_type == 'CNOT' and target == qubit:
+            print(f"Error applying gate {gate_type}: control equals target")
+            continue
+        sequence.append((TWO_QUBIT_GATES[gate_type], qubit, target))
+    return sequence
+
+
+# ?precision= values for a compact state vector: interleaved real/imag,
+# little-endian, base64-encoded
+PACKED_PRECISIONS = {
+    'fp16': np.dtype('<f2'),
+    'fp32': np.dtype('<f4'),
+}
+
+
+def pack_statevector(vec, dtype):
+    """Interleave real/imag parts of vec as dtype and base64-encode them"""
+    packed = np.empty(2 * vec.size, dtype=dtype)
+    packed[0::2] = vec.real
+    packed[1::2] = vec.imag
+    return base64.b64encode(packed.tobytes()).decode('ascii')
+
+
+# Idle simulator states kept between requests, at most one per qubit
+# count: reusing a buffer skips a 2^n allocation (and its page faults),
+# which dominates for large registers. The client picks the qubit count,
+# so the pool is capped by total buffer size; anything beyond that is
+# freed as before.
+POOL_MAX_BYTES = 256 * 1024 * 1024
+_idle_states = {}
+_idle_bytes = 0
+_idle_lock = threading.Lock()
+
+
+def _state_bytes(num_qubits):
+    return 16 << num_qubits  # complex128 amplitudes
+
+
+def acquire_state(num_qubits):
+    """Return a |0...0⟩ QuantumState, reusing an idle one if available"""
+    global _idle_bytes
+    with _idle_lock:
+        qs = _idle_states.pop(num_qubits, None)
+        if qs is not None:
+            _idle_bytes -= _state_bytes(num_qubits)
+    if qs is None:
+        return QuantumState(num_qubits)
+    return qs.reset()
+
+
+def release_state(qs):
+    """Hand a state back for reuse, or drop it if the pool is full"""
+    global _idle_bytes
+    size = _state_bytes(qs.num_qubits)
+    with _idle_lock:
+        if (qs.num_qubits not in _idle_states
+                and _idle_bytes + size <= POOL_MAX_BYTES):
+            _idle_states[qs.num_qubits] = qs
+            _idle_bytes += size
+
+
+def read_json():
+    """request.json, decoded with orjson when it is installed"""
+    if orjson is None:
+        return request.json
+    return orjson.loads(request.get_data(cache=False))
+
+
+def json_response(payload):
+    """jsonify(payload), encoded with orjson when it is installed"""
+    if orjson is None:
+        return jsonify(payload)
+    return Response(orjson.dumps(payload), mimetype='application/json')
+
 
 @app.route('/')
 def index():
@@ -32,70 +155,65 @@ def app_js():
 def execute_circuit():
     """Execute quantum circuit and return results"""
     try:
-        data = request.json
+        data = read_json()
         num_qubits = data.get('num_qubits', 3)
         gates = data.get('gates', [])
         
-        # Create quantum state
-        qs = QuantumState(num_qubits)
+        # Create quantum state (reusing a pooled buffer when possible)
+        qs = acquire_state(num_qubits)
         
-        # Apply gates
-        for gate_info in gates:
-            gate_type = gate_info['gate']
-            qubit = gate_info['qubit']
-            
-            try:
-                if gate_type == 'H':
-                    qs.h(qubit)
-                elif gate_type == 'X':
-                    qs.x(qubit)
-                elif gate_type == 'Y':
-                    qs.y(qubit)
-                elif gate_type == 'Z':
-                    qs.z(qubit)
-                elif gate_type == 'S':
-                    qs.s(qubit)
-                elif gate_type == 'T':
-                    qs.t(qubit)
-                elif gate_type == 'CNOT':
-                    # Simple: use qubit and qubit+1
-                    target = (qubit + 1) % num_qubits
-                    qs.cnot(qubit, target)
-                elif gate_type == 'CZ':
-                    target = (qubit + 1) % num_qubits
-                    qs.cz(qubit, target)
-                elif gate_type == 'SWAP':
-                    target = (qubit + 1) % num_qubits
-                    qs.swap(qubit, target)
-            except Exception as e:
-                print(f"Error applying gate {gate_type}: {e}")
+        # Apply all gates with one call into the C engine
+        qs.apply_gates(build_gate_sequence(gates, num_qubits))
+        
+        # ?state_vector=0 skips the 2^n amplitudes for clients that only
+        # draw probabilities (the Bloch sphere still needs them for n == 1)
+        send_state = request.args.get('state_vector', '1') != '0'
         
         # Get probabilities
         probs = qs.probabilities()
+        vec = qs.get_statevector() if send_state or num_qubits == 1 else None
+        release_state(qs)  # probs and vec are copies
         
         # Calculate Bloch sphere coordinates for single qubit
         bloch_coords = None
         if num_qubits == 1:
-            vec = qs.get_statevector()
-            alpha = vec[0]
-            beta = vec[1]
+            alpha = complex(vec[0])
+            beta = complex(vec[1])
             
-            # Calculate theta and phi from Bloch sphere representation
-            theta = 2 * np.arccos(np.abs(alpha))
-            phi = np.angle(beta) - np.angle(alpha)
+            # Calculate theta and phi from Bloch sphere representation:
+            # theta = 2*atan2(|β|, |α|), phi = arg(conj(α)·β), each one
+            # atan2 on plain floats (stable near the poles, unlike arccos)
+            theta = 2 * math.atan2(abs(beta), abs(alpha))
+            phi = math.atan2(alpha.real * beta.imag - alpha.imag * beta.real,
+                             alpha.real * beta.real + alpha.imag * beta.imag)
             
             bloch_coords = {
-                'theta': float(theta),
-                'phi': float(phi)
+                'theta': theta,
+                'phi': phi
             }
         
-        return jsonify({
+        result = {
             'success': True,
             'probabilities': probs.tolist(),
             'bloch': bloch_coords,
-            'state_vector': [{'real': c.real, 'imag': c.imag} 
-                           for c in qs.get_statevector()]
-        })
+        }
+        
+        if send_state:
+            # Opt-in reduced precision for visualization clients; probabilities
+            # above are still computed and sent in full precision
+            precision = request.args.get('precision')
+            if precision in PACKED_PRECISIONS:
+                result['state_vector_precision'] = precision
+                result['state_vector_packed'] = pack_statevector(
+                    vec, PACKED_PRECISIONS[precision])
+            else:
+                # tolist() converts the real/imag parts in C instead of creating
+                # one numpy scalar per amplitude
+                result['state_vector'] = [
+                    {'real': re, 'imag': im}
+                    for re, im in zip(vec.real.tolist(), vec.imag.tolist())
+                ]
+        return json_response(result)
         
     except Exception as e:
         return jsonify({